@@ -0,0 +1,196 @@
+"""
+Async Render Pipeline
+Awaitable rendering for asyncio consumers: parsing, layout and serialization
+run in an executor while one event loop bounds concurrency and queue depth
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Marks the end of the input queue
+_DONE = object()
+
+
+def render_source(source, engine="platypus", fit_pages=None):
+    """Parse (if source is a path) and render a resume, returning PDF bytes"""
+    from resume_generator import ResumeGenerator
+
+    if isinstance(source, (str, Path)):
+        generator = ResumeGenerator(str(source))
+        generator.parse_input_file()
+    else:
+        generator = ResumeGenerator.from_data(source)
+    generator.validate()
+    generator.engine = engine
+    if fit_pages:
+        generator.fit_to_pages(fit_pages)
+    return generator.render_bytes()
+
+
+async def render_async(
+    source, executor=None, semaphore=None, engine="platypus", fit_pages=None
+):
+    """Render resume data or a YAML path in executor and return the PDF bytes
+
+    With executor None the loop's default thread pool is used; pass a
+    process pool to render in parallel. A semaphore, when given, is held
+    for the duration of the render to cap concurrent jobs.
+    """
+    loop = asyncio.get_running_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(
+            executor, render_source, source, engine, fit_pages
+        )
+    async with semaphore:
+        return await loop.run_in_executor(
+            executor, render_source, source, engine, fit_pages
+        )
+
+
+class RenderPipeline:
+    """Bounded async pipeline from submitted resumes to completed PDFs
+
+    put() waits while max_queue jobs are waiting, so producers slow down to
+    the render rate. At most max_concurrency renders run in the executor at
+    once, and results() yields (key, pdf bytes, error) in completion order.
+    At most max_concurrency finished results wait for the consumer, so a slow
+    consumer throttles dispatch too; consume results() concurrently with
+    put(), as render_all does. Use as an async context manager; leaving it
+    closes the input side.
+    """
+
+    def __init__(
+        self,
+        executor=None,
+        max_concurrency=None,
+        max_queue=None,
+        engine="platypus",
+        fit_pages=None,
+    ):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.owns_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(self.max_concurrency)
+        self.engine = engine
+        self.fit_pages = fit_pages
+        self._inputs = asyncio.Queue(max_queue or 2 * self.max_concurrency)
+        self._results = asyncio.Queue(self.max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._dispatcher = None
+        self._closed = False
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        drain = None
+        if exc_info[0] is None:
+            # Queued jobs still finish; discard results nobody is left to read
+            # so they are not blocked behind a full results queue
+            drain = asyncio.create_task(self._drain())
+            await self.close()
+        else:
+            # Abandon queued jobs rather than wait on a consumer that is gone
+            self._closed = True
+            self._dispatcher.cancel()
+        await asyncio.gather(self._dispatcher, return_exceptions=True)
+        if drain is not None:
+            drain.cancel()
+        if self.owns_executor:
+            self.executor.shutdown(wait=exc_info[0] is None, cancel_futures=True)
+
+    def start(self):
+        """Start dispatching queued jobs; called by the context manager"""
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def put(self, key, source):
+        """Queue resume data or a YAML path, waiting while the queue is full"""
+        if self._closed:
+            raise RuntimeError("pipeline is closed")
+        await self._inputs.put((key, source))
+
+    async def close(self):
+        """Stop accepting jobs; results() ends once queued jobs finish"""
+        if not self._closed:
+            self._closed = True
+            await self._inputs.put(_DONE)
+
+    async def results(self):
+        """Yield (key, pdf bytes or None, error or None) as renders complete"""
+        while True:
+            result = await self._results.get()
+            if result is _DONE:
+                return
+            yield result
+
+    async def _drain(self):
+        while await self._results.get() is not _DONE:
+            pass
+
+    async def _dispatch(self):
+        running = set()
+        try:
+            while True:
+                job = await self._inputs.get()
+                if job is _DONE:
+                    break
+                # Holding a slot before dequeuing more is what keeps the
+                # input queue full and applies backpressure to put()
+                await self._semaphore.acquire()
+                task = asyncio.create_task(self._render(*job))
+                running.add(task)
+                task.add_done_callback(running.discard)
+            await asyncio.gather(*running)
+        except asyncio.CancelledError:
+            # The consumer is gone, so no end marker: a full results queue
+            # would block it forever
+            for task in list(running):
+                task.cancel()
+            raise
+        await self._results.put(_DONE)
+
+    async def _render(self, key, source):
+        try:
+            pdf = await asyncio.get_running_loop().run_in_executor(
+                self.executor, render_source, source, self.engine, self.fit_pages
+            )
+        except Exception as e:
+            await self._results.put((key, None, f"{type(e).__name__}: {e}"))
+        else:
+            await self._results.put((key, pdf, None))
+        finally:
+            # Released only once the result is queued, so renders stop
+            # starting while finished ones wait for the consumer
+            self._semaphore.release()
+
+
+async def render_all(sources, **options):
+    """Render an iterable of (key, source) pairs, yielding results as they finish
+
+    Options are passed to RenderPipeline. Sources are fed from a separate
+    task, so results stream back while later inputs are still queued.
+    """
+    async with RenderPipeline(**options) as pipeline:
+
+        async def feed():
+            try:
+                for key, source in sources:
+                    await pipeline.put(key, source)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Let queued jobs drain so the error surfaces from await feeder
+                await pipeline.close()
+                raise
+            await pipeline.close()
+
+        feeder = asyncio.create_task(feed())
+        try:
+            async for result in pipeline.results():
+                yield result
+            await feeder
+        finally:
+            feeder.cancel()
@@ -0,0 +1,314 @@
+"""
+Batch Resume Rendering
+Renders many resume YAML files in parallel using a process pool
+"""
+
+import gc
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from multiprocessing import get_all_start_methods, get_context
+from pathlib import Path
+
+YAML_SUFFIXES = (".yaml", ".yml")
+
+
+def collect_inputs(sources):
+    """Expand directories and manifest files into (YAML path, output name) pairs
+
+    Files found under a directory or listed in a manifest keep their path
+    relative to it in the output name, so same-named files in different
+    subdirectories do not overwrite each other. Any remaining clash is
+    rejected up front.
+    """
+    inputs = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            for found in sorted(
+                p for p in path.rglob("*") if p.suffix in YAML_SUFFIXES
+            ):
+                name = found.relative_to(path).with_suffix(".pdf")
+                inputs.append((found, str(name)))
+        elif path.suffix in YAML_SUFFIXES:
+            inputs.append((path, f"{path.stem}.pdf"))
+        else:
+            # Manifest: one YAML path per line, relative to the manifest itself
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        # Named by the listed path, like directory entries,
+                        # unless that would escape the output directory
+                        name = Path(line).with_suffix(".pdf")
+                        if name.is_absolute() or ".." in name.parts:
+                            name = Path(name.name)
+                        inputs.append((path.parent / line, str(name)))
+
+    seen = {}
+    for path, name in inputs:
+        if name in seen:
+            raise ValueError(f"{seen[name]} and {path} would both render to {name}")
+        seen[name] = path
+    return inputs
+
+
+# Render cache opened lazily once per worker process
+_worker_cache = None
+
+
+def _get_worker_cache(cache_dir, cache_max_bytes):
+    """Return this worker's render cache, opening it on first use"""
+    global _worker_cache
+    if _worker_cache is None:
+        from cache import RenderCache
+
+        _worker_cache = RenderCache(cache_dir, cache_max_bytes)
+    return _worker_cache
+
+
+def render_one(
+    input_file,
+    output_file,
+    snapshot_dir=None,
+    engine="platypus",
+    profile=False,
+    cache_dir=None,
+    cache_max_bytes=None,
+    max_pages=None,
+    forms=False,
+):
+    """Parse and render a single resume, returning (error, elapsed, cache hit)
+
+    With max_pages, resumes predicted to run longer are rejected from a
+    wrap-only layout estimate before any PDF is serialized.
+    """
+    from resume_generator import ResumeGenerator
+
+    start = time.perf_counter()
+    cache = _get_worker_cache(cache_dir, cache_max_bytes) if cache_dir else None
+    hits = cache.hits if cache else 0
+    try:
+        generator = ResumeGenerator(str(input_file), str(output_file), snapshot_dir)
+        generator.engine = engine
+        generator.use_forms = forms
+        if profile:
+            from profiling import PhaseTimer
+
+            generator.timer = PhaseTimer()
+        generator.parse_input_file()
+        # Schema problems fail here, in microseconds, before any layout work
+        generator.validate()
+        generator.generate_pdf(verbose=False, cache=cache, max_pages=max_pages)
+        if profile:
+            generator.timer.write_report(
+                f"{output_file}.timings.json", input=str(input_file)
+            )
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", time.perf_counter() - start, False
+    cache_hit = bool(cache) and cache.hits > hits
+    return None, time.perf_counter() - start, cache_hit
+
+
+def _document_filename(index, document):
+    """Output file name for the index-th document of a stream"""
+    name = (document.get("personal") or {}).get("name", "")
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", str(name)).strip("-")
+    return f"{index:05d}-{slug}.pdf" if slug else f"{index:05d}.pdf"
+
+
+def render_stream(input_file, output_dir, cache=None, forms=False):
+    """Render each document of a YAML stream as it is parsed
+
+    Yields (output path, error) per document, error being None on success,
+    so one bad document is reported without stopping the rest. Documents are
+    parsed one at a time, so memory stays flat regardless of stream size and
+    the first PDF exists before the last document is read.
+    """
+    from resume_generator import ResumeGenerator, iter_documents
+
+    if not Path(input_file).exists():
+        raise FileNotFoundError(f"Input file {input_file} not found!")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for index, document in enumerate(iter_documents(input_file), start=1):
+        output_file = output_dir / _document_filename(index, {})
+        try:
+            # Validated before naming, which assumes a mapping document
+            generator = ResumeGenerator.from_data(document)
+            generator.validate()
+            output_file = output_dir / _document_filename(index, document)
+            generator.output_file = str(output_file)
+            generator.use_forms = forms
+            generator.generate_pdf(verbose=False, cache=cache)
+        except Exception as e:
+            yield output_file, f"{type(e).__name__}: {e}"
+            continue
+        yield output_file, None
+
+
+class BatchResult:
+    """Outcome of a batch run"""
+
+    def __init__(self):
+        self.succeeded = []
+        self.failed = []
+        self.unverified = []
+        self.cache_hits = 0
+        self.elapsed = 0.0
+
+    @property
+    def total(self):
+        return len(self.succeeded) + len(self.failed)
+
+    @property
+    def docs_per_sec(self):
+        return len(self.succeeded) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        """Human readable throughput summary"""
+        return (
+            f"Rendered {len(self.succeeded)}/{self.total} resumes "
+            f"in {self.elapsed:.2f}s ({self.docs_per_sec:.1f} docs/sec), "
+            f"{len(self.failed)} failed, {len(self.unverified)} failed verification, "
+            f"{self.cache_hits} cache hit(s)"
+        )
+
+
+def _prewarm_worker():
+    """Pool initializer that warms a freshly started (not forked) worker"""
+    from resume_generator import prewarm
+
+    prewarm()
+
+
+@contextmanager
+def worker_pool(workers, start_method=None):
+    """Yield a process pool whose workers start with warm render state
+
+    With fork (used where it is the platform default) the parent imports
+    reportlab, builds the stylesheet and loads the font metrics once, then
+    freezes those objects out of the garbage collector until the pool shuts
+    down, so collections in the children do not write to them and copy
+    their shared pages. Spawned or forkserver workers cannot inherit that
+    state and warm themselves up instead.
+    """
+    if start_method is None:
+        # The first method is the platform default, e.g. spawn on macOS
+        # where forking is unsafe
+        start_method = get_all_start_methods()[0]
+    if start_method != "fork":
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context(start_method),
+            initializer=_prewarm_worker,
+        ) as pool:
+            yield pool
+        return
+
+    from resume_generator import prewarm
+
+    prewarm()
+    gc.freeze()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("fork")
+        ) as pool:
+            yield pool
+    finally:
+        gc.unfreeze()
+
+
+def _error(future):
+    """Describe the exception of a future whose worker itself died"""
+    exception = future.exception()
+    return f"{type(exception).__name__}: {exception}" if exception else None
+
+
+def run_batch(
+    sources,
+    output_dir,
+    workers=None,
+    snapshot_dir=None,
+    engine="platypus",
+    profile=False,
+    cache_dir=None,
+    cache_max_bytes=None,
+    verify=False,
+    max_pages=None,
+    start_method=None,
+    forms=False,
+):
+    """Render every resume found in sources into output_dir
+
+    With verify, each PDF is checked by a verification task in the same pool
+    as soon as it is rendered. Renders are submitted a few at a time so those
+    checks interleave with the remaining renders instead of queueing behind
+    all of them.
+    """
+    inputs = iter(collect_inputs(sources))
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    result = BatchResult()
+    start = time.perf_counter()
+    with worker_pool(workers, start_method) as pool:
+        pending = {}  # future -> (task kind, input path, output path)
+
+        def submit_renders():
+            while len(pending) < 2 * workers:
+                path, name = next(inputs, (None, None))
+                if path is None:
+                    return
+                output_file = output_dir / name
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                future = pool.submit(
+                    render_one,
+                    path,
+                    output_file,
+                    snapshot_dir,
+                    engine,
+                    profile,
+                    cache_dir,
+                    cache_max_bytes,
+                    max_pages,
+                    forms,
+                )
+                pending[future] = ("render", path, output_file)
+
+        submit_renders()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, path, output_file = pending.pop(future)
+                # A dead worker (e.g. BrokenProcessPool) surfaces as an exception
+                crashed = _error(future)
+
+                if kind == "verify":
+                    problems = [crashed] if crashed else future.result()
+                    if problems:
+                        result.unverified.append((path, problems))
+                    continue
+
+                error, _, cache_hit = crashed, None, False
+                if not crashed:
+                    error, _, cache_hit = future.result()
+                result.cache_hits += cache_hit
+                if error:
+                    result.failed.append((path, error))
+                    continue
+                result.succeeded.append(path)
+                if verify:
+                    from verify import verify_file
+
+                    future = pool.submit(
+                        verify_file, path, output_file, max_pages, snapshot_dir
+                    )
+                    pending[future] = ("verify", path, output_file)
+            submit_renders()
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Layout Engine Benchmark
+Compares render latency of the platypus engine against the direct canvas engine.
+With --check, first confirms both engines place every word identically.
+"""
+
+import sys
+from io import BytesIO
+import time
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_render import SCENARIOS  # noqa: E402
+from resume_generator import ResumeGenerator  # noqa: E402
+from synthetic import make_resume  # noqa: E402
+
+
+def bench(data, engine, iterations):
+    """Return the median render time in milliseconds"""
+    samples = []
+    for _ in range(iterations):
+        generator = ResumeGenerator.from_data(data)
+        generator.engine = engine
+        # The canvas engine never uses the section cache; keep platypus cold too
+        generator.section_cache = None
+        start = time.perf_counter()
+        generator.render_bytes()
+        samples.append((time.perf_counter() - start) * 1000)
+    return median(samples)
+
+
+def long_link_resume():
+    """A resume whose project link is wider than a line, split by both engines"""
+    data = make_resume(2, 3, 10, 1)
+    data["projects"][0]["link"] = "https://example.com/" + "x" * 110
+    return data
+
+
+def word_positions(data, engine):
+    """Every word of the rendered PDF with its page and rounded position"""
+    import pdfplumber
+
+    generator = ResumeGenerator.from_data(data)
+    generator.engine = engine
+    with pdfplumber.open(BytesIO(generator.render_bytes())) as pdf:
+        return [
+            (page.page_number, w["text"], round(w["x0"], 1), round(w["top"], 1))
+            for page in pdf.pages
+            for w in page.extract_words()
+        ]
+
+
+def check(cases):
+    """Report whether both engines lay out each case identically"""
+    ok = True
+    for name, data in cases.items():
+        same = word_positions(data, "platypus") == word_positions(data, "canvas")
+        ok = ok and same
+        print(f"{name:<11} {'identical' if same else 'DIFFERENT'}")
+    return ok
+
+
+def main():
+    args = sys.argv[1:]
+    if "--check" in args:
+        args.remove("--check")
+        cases = {name: make_resume(*size) for name, size in SCENARIOS.items()}
+        cases["long-link"] = long_link_resume()
+        if not check(cases):
+            sys.exit(1)
+    iterations = int(args[0]) if args else 30
+    print(f"{'Scenario':<11} {'platypus':>10} {'canvas':>10} {'speedup':>8}")
+    for name, size in SCENARIOS.items():
+        data = make_resume(*size)
+        bench(data, "platypus", 2)  # warm up
+        bench(data, "canvas", 2)
+        platypus = bench(data, "platypus", iterations)
+        canvas = bench(data, "canvas", iterations)
+        print(
+            f"{name:<11} {platypus:>8.2f}ms {canvas:>8.2f}ms {platypus / canvas:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Template-and-Overlay Benchmark
+Renders many variants of one synthetic resume two ways: full re-rendering of
+every variant, and a header template rendered once and stamped onto
+body-only layouts with PyPDF2. Reports per-variant latency and output size.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_render import SCENARIOS  # noqa: E402
+
+
+def variants_of(data, count):
+    """Return count variants of data, each dropping a different bullet"""
+    variants = []
+    for index in range(count):
+        experience = []
+        for exp in data["experience"]:
+            bullets = exp["responsibilities"]
+            drop = index % len(bullets) if bullets else None
+            kept = [b for j, b in enumerate(bullets) if j != drop]
+            experience.append(dict(exp, responsibilities=kept))
+        variants.append(dict(data, experience=experience))
+    return variants
+
+
+def run_scenario(name, count):
+    """Time full and overlay rendering of count variants of one scenario"""
+    from overlay import HeaderTemplate
+    from resume_generator import ResumeGenerator
+    from synthetic import make_resume
+
+    variants = variants_of(make_resume(*SCENARIOS[name]), count)
+    ResumeGenerator.from_data(variants[0]).render_bytes()  # warm up
+
+    full = []
+    for data in variants:
+        start = time.perf_counter()
+        full_size = len(ResumeGenerator.from_data(data).render_bytes())
+        full.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    template = HeaderTemplate(variants[0]["personal"])
+    template.page()
+    template_ms = (time.perf_counter() - start) * 1000
+
+    overlay = []
+    for data in variants:
+        start = time.perf_counter()
+        overlay_size = len(template.render(data))
+        overlay.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "full_ms": median(full),
+        "overlay_ms": median(overlay),
+        "template_ms": template_ms,
+        "full_total_ms": sum(full),
+        "overlay_total_ms": template_ms + sum(overlay),
+        "full_bytes": full_size,
+        "overlay_bytes": overlay_size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--variants", type=int, default=100)
+    parser.add_argument(
+        "-s", "--scenario", action="append", choices=SCENARIOS, default=None
+    )
+    args = parser.parse_args()
+
+    for name in args.scenario or ("typical", "multi-page"):
+        r = run_scenario(name, args.variants)
+        print(
+            f"{name:<11} full p50 {r['full_ms']:6.2f} ms  "
+            f"overlay p50 {r['overlay_ms']:6.2f} ms "
+            f"(+ {r['template_ms']:.2f} ms template once)  "
+            f"total {r['full_total_ms']:7.1f} vs {r['overlay_total_ms']:7.1f} ms  "
+            f"pdf {r['full_bytes']} vs {r['overlay_bytes']} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
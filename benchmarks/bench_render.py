@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+End-to-End Render Benchmark
+Renders synthetic resumes of increasing size and reports latency percentiles
+per phase, peak RSS and output size. Each scenario runs in a fresh process so
+peak RSS is attributable to that scenario alone.
+"""
+
+import argparse
+import json
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from statistics import quantiles
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# name: (experiences, bullets per experience, skills, projects)
+SCENARIOS = {
+    "small": (1, 3, 10, 0),
+    "typical": (3, 5, 30, 0),
+    "large": (6, 8, 60, 3),
+    "multi-page": (12, 10, 120, 10),
+}
+
+
+def percentiles(samples):
+    """Return p50/p90/p99 of samples in milliseconds"""
+    if len(samples) < 2:
+        return {"p50": samples[0], "p90": samples[0], "p99": samples[0]}
+    cuts = quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p90": cuts[89], "p99": cuts[98]}
+
+
+def run_scenario(name, iterations):
+    """Render one scenario repeatedly and collect its statistics"""
+    from resume_generator import ResumeGenerator
+    from profiling import PhaseTimer
+    from synthetic import make_resume
+
+    data = make_resume(*SCENARIOS[name])
+    ResumeGenerator.from_data(data).render_bytes()  # warm up
+
+    totals = []
+    phases = {}
+    size = 0
+    for _ in range(iterations):
+        generator = ResumeGenerator.from_data(data)
+        # Measure section construction, not copies of cached flowables
+        generator.section_cache = None
+        generator.timer = PhaseTimer()
+        start = time.perf_counter()
+        size = len(generator.render_bytes())
+        totals.append((time.perf_counter() - start) * 1000)
+        for phase in generator.timer.phases:
+            phases.setdefault(phase["phase"], []).append(phase["wall_ms"])
+
+    return {
+        "scenario": name,
+        "iterations": iterations,
+        "total_ms": percentiles(totals),
+        "phases_ms": {phase: percentiles(s) for phase, s in phases.items()},
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "output_bytes": size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=50)
+    parser.add_argument(
+        "-s", "--scenario", action="append", choices=SCENARIOS, default=None
+    )
+    parser.add_argument("--json", default=None, help="Also write results here")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.scenario or SCENARIOS:
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+            result = pool.submit(run_scenario, name, args.iterations).result()
+        results.append(result)
+
+        total = result["total_ms"]
+        print(
+            f"{name:<11} p50 {total['p50']:7.2f} ms  p90 {total['p90']:7.2f} ms  "
+            f"p99 {total['p99']:7.2f} ms  rss {result['peak_rss_kb'] / 1024:6.1f} MB  "
+            f"pdf {result['output_bytes'] / 1024:6.1f} KB"
+        )
+        for phase, stats in result["phases_ms"].items():
+            print(f"    {phase:<36} p50 {stats['p50']:7.2f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+CLI Cold-Start Benchmark
+Measures interpreter start plus import cost of the CLI using -X importtime,
+for the help path and for the render path that loads reportlab
+"""
+
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+ROOT = Path(__file__).resolve().parent.parent
+
+COMMANDS = {
+    "main.py --help": ["main.py", "--help"],
+    "import resume_generator": ["-c", "import resume_generator"],
+}
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def top_level_imports(stderr):
+    """Return {module: cumulative microseconds} for top-level imports"""
+    imports = {}
+    for match in _IMPORTTIME_RE.finditer(stderr):
+        if len(match.group(3)) == 1:
+            imports[match.group(4)] = int(match.group(2))
+    return imports
+
+
+def run(args, iterations):
+    """Return median wall ms, median import ms and the slowest imports"""
+    walls = []
+    imports = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        walls.append((time.perf_counter() - start) * 1000)
+        imports.append(top_level_imports(proc.stderr))
+    totals = [sum(i.values()) / 1000 for i in imports]
+    slowest = sorted(imports[-1].items(), key=lambda item: -item[1])[:5]
+    return median(walls), median(totals), slowest
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for label, args in COMMANDS.items():
+        wall, imports, slowest = run(args, iterations)
+        print(f"{label:<26} wall {wall:7.1f} ms  imports {imports:7.1f} ms")
+        for module, micros in slowest:
+            print(f"    {module:<30} {micros / 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Stylesheet Construction Benchmark
+Compares per-instance ResumeGenerator construction cost when every instance
+rebuilds its stylesheet (before) versus borrowing the shared registry (after)
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resume_generator import ResumeGenerator, _build_stylesheet  # noqa: E402
+
+
+class RebuildingResumeGenerator(ResumeGenerator):
+    """Generator that rebuilds its styles on every instantiation, as before"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.styles = _build_stylesheet()
+
+
+def bench(cls, number):
+    """Return the mean construction time in microseconds"""
+    return timeit.timeit(cls, number=number) / number * 1e6
+
+
+def main():
+    number = 2000
+    ResumeGenerator()  # warm the registry
+
+    before = bench(RebuildingResumeGenerator, number)
+    after = bench(ResumeGenerator, number)
+
+    print(f"Per-instance construction ({number} instances)")
+    print(f"  rebuild stylesheet: {before:8.2f} us")
+    print(f"  shared registry:    {after:8.2f} us")
+    print(f"  speedup:            {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Worker Start-Method Benchmark
+Compares the per-worker cost of starting a render worker by spawn, forkserver,
+plain fork and fork from a prewarmed parent: time from pool creation to the
+first finished render, and the worker's private (unshared) memory afterwards.
+Each mode is driven from a fresh interpreter so parent state does not leak
+between modes.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+MODES = ("spawn", "forkserver", "fork", "fork+prewarm")
+
+
+def memory_kb():
+    """Return (private, shared) resident kB of this process, Linux only"""
+    totals = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.startswith(("Private_", "Shared_")) and value.endswith("kB\n"):
+                    kind = key.split("_")[0]
+                    totals[kind] = totals.get(kind, 0) + int(value.split()[0])
+    except OSError:
+        return None, None
+    return totals.get("Private"), totals.get("Shared")
+
+
+def first_render(data):
+    """Render once in a worker and report its memory afterwards"""
+    from resume_generator import ResumeGenerator
+
+    ResumeGenerator.from_data(data).render_bytes()
+    return memory_kb()
+
+
+def run_mode(mode, workers, iterations):
+    """Start pools in one mode and collect per-worker startup statistics"""
+    from batch import worker_pool
+    from synthetic import make_resume
+
+    data = make_resume(3, 5, 30, 0)
+    start_method = mode.split("+")[0]
+    if mode == "fork":
+        # A plain fork inherits only what the parent imported: nothing yet
+        def make_pool():
+            return ProcessPoolExecutor(workers, mp_context=get_context("fork"))
+
+    else:
+
+        def make_pool():
+            return worker_pool(workers, start_method)
+
+    startup = []
+    memory = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        with make_pool() as pool:
+            results = list(pool.map(first_render, [data] * workers))
+            # Every worker has rendered once by the time the slowest finishes
+            startup.append((time.perf_counter() - start) * 1000 / workers)
+        memory.extend(results)
+
+    private = [p for p, _ in memory if p is not None]
+    shared = [s for _, s in memory if s is not None]
+    return {
+        "mode": mode,
+        "startup_ms_per_worker": median(startup),
+        "private_kb": median(private) if private else None,
+        "shared_kb": median(shared) if shared else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-j", "--workers", type=int, default=4)
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    available = get_all_start_methods()
+    for mode in MODES:
+        if mode.split("+")[0] not in available:
+            continue
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as driver:
+            result = driver.submit(
+                run_mode, mode, args.workers, args.iterations
+            ).result()
+        private, shared = result["private_kb"], result["shared_kb"]
+        memory = (
+            f"private {private / 1024:6.1f} MB  shared {shared / 1024:6.1f} MB"
+            if private is not None
+            else "memory n/a"
+        )
+        print(f"{mode:<13} {result['startup_ms_per_worker']:7.1f} ms/worker  {memory}")
+
+
+if __name__ == "__main__":
+    main()
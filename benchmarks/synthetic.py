@@ -0,0 +1,69 @@
+"""
+Synthetic Resume Data
+Generates deterministic resume data of arbitrary size for benchmarking
+"""
+
+import random
+
+WORDS = (
+    "designed implemented migrated optimized reduced improved automated scaled "
+    "built deployed monitored streamlined architected led delivered service "
+    "pipeline cluster latency throughput reliability costs infrastructure team "
+    "platform kubernetes terraform python postgres redis kafka spark trino aws "
+    "observability alerting dashboards onboarding incidents developers releases "
+    "security by with across for and the of to 30% 40% 50% 60% 90%"
+).split()
+
+COMPANIES = ("Autodesk", "Oracle", "16 Bit Inc", "Initech", "Globex", "Hooli")
+LOCATIONS = ("Toronto, Canada", "Bengaluru, India", "Seattle, USA", "Remote")
+TITLES = ("Software Engineer", "Senior Engineer", "Member Technical Staff")
+
+
+def _sentence(rng, words):
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def make_resume(experiences=3, bullets=5, skills=30, projects=0, seed=0):
+    """Build resume data with experiences x bullets, skills and projects"""
+    rng = random.Random(seed)
+    return {
+        "personal": {
+            "name": "Synthetic Candidate",
+            "email": "candidate@example.com",
+            "phone": "+1 (555) 010-0000",
+            "location": "Toronto, Canada",
+            "linkedin": "linkedin.com/in/candidate",
+            "github": "github.com/candidate",
+        },
+        "experience": [
+            {
+                "company": rng.choice(COMPANIES),
+                "title": rng.choice(TITLES),
+                "location": rng.choice(LOCATIONS),
+                "duration": f"{1 + i % 12:02d}/20{10 + i % 15} – Present",
+                "responsibilities": [
+                    _sentence(rng, rng.randint(14, 32)) for _ in range(bullets)
+                ],
+            }
+            for i in range(experiences)
+        ],
+        "education": [
+            {
+                "institution": "University of Toronto",
+                "degree": "Masters in Computer Science",
+                "duration": "09/2022 – 12/2023",
+                "location": "Toronto, Canada",
+            }
+        ],
+        "skills": [f"{rng.choice(WORDS).title()} {i}" for i in range(skills)],
+        "projects": [
+            {
+                "name": f"Project {i}",
+                "description": _sentence(rng, 24),
+                "technologies": ", ".join(rng.sample(WORDS, 4)),
+                "link": f"github.com/candidate/project-{i}",
+            }
+            for i in range(projects)
+        ],
+    }
@@ -0,0 +1,169 @@
+"""
+Rendered Resume Cache
+Content-addressed, size-bounded store of rendered PDFs keyed on the parsed
+resume data, the layout configuration and the layout version
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, eviction still rescans
+    fcntl = None
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def cache_key(data, layout_config, version):
+    """Hash canonicalized resume data together with the layout it is rendered with"""
+    payload = json.dumps(
+        {"data": data, "layout": layout_config, "version": version},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """LRU cache of rendered PDFs stored as <key>.pdf files in a directory
+
+    Several processes may share one directory. Their combined size is kept in
+    a state file updated under a lock, and eviction rescans the directory, so
+    entries written by every process count against max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock_path = self.directory / ".lock"
+        self._size_path = self.directory / ".size"
+        with self._locked():
+            self._write_size(sum(size for _, _, size in self._scan()))
+
+    def _path(self, key):
+        return self.directory / f"{key}.pdf"
+
+    @contextmanager
+    def _locked(self):
+        """Hold the directory lock shared by every process using this cache"""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _scan(self):
+        """Return (mtime, path, size) of every cached PDF, oldest first"""
+        entries = []
+        for path in self.directory.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return sorted(entries)
+
+    def _read_size(self):
+        try:
+            return int(self._size_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return sum(size for _, _, size in self._scan())
+
+    def _write_size(self, size):
+        self._size_path.write_text(str(size))
+
+    def get(self, key):
+        """Return the cached PDF path for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            # Touch the entry so it survives eviction in this and other processes
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def copy_to(self, key, destination):
+        """Copy the cached PDF for key to destination; False on a miss"""
+        path = self.get(key)
+        if path is None:
+            return False
+        try:
+            shutil.copyfile(path, destination)
+        except FileNotFoundError:
+            # Evicted by another process between the lookup and the copy
+            self.hits -= 1
+            self.misses += 1
+            return False
+        return True
+
+    def put(self, key, pdf_bytes):
+        """Store rendered PDF bytes under key and evict down to the size bound"""
+        # Write to a temporary file first so readers never see a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+
+        path = self._path(key)
+        with self._locked():
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            size = self._read_size() + len(pdf_bytes) - replaced
+            if size > self.max_bytes:
+                size = self._evict(keep=path)
+            self._write_size(size)
+        return path
+
+    def _evict(self, keep):
+        """Drop least recently used entries, except keep, until under max_bytes
+
+        Rescans the directory rather than trusting any one process's view,
+        and returns the resulting total size. Called with the lock held.
+        """
+        entries = self._scan()
+        size = sum(entry_size for _, _, entry_size in entries)
+        for _, path, entry_size in entries:
+            if size <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+            self.evictions += 1
+        return size
+
+    def stats(self):
+        """Return hit/miss counters and current cache size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": sum(1 for _ in self.directory.glob("*.pdf")),
+            "bytes": self._read_size(),
+        }
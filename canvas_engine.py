@@ -0,0 +1,408 @@
+"""
+Direct Canvas Rendering Engine
+Lays out the fixed resume structure straight onto a reportlab Canvas,
+bypassing platypus' frame and flowable split machinery
+"""
+
+import re
+from html import unescape
+
+from reportlab import rl_config
+from reportlab.lib.colors import black, grey
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen.canvas import Canvas
+
+from font_metrics import string_width
+from resume_generator import item_text
+
+# Frame padding used by SimpleDocTemplate, kept so both engines line up
+FRAME_PADDING = 6
+
+# Fraction of a space platypus lets each gap shrink by to make a line fit
+SPACE_SHRINKAGE = rl_config.spaceShrinkage
+
+_TAG_RE = re.compile(r"<(/?)(\w+)[^>]*>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _bold_font(font_name):
+    """Bold variant of a standard Type 1 font family"""
+    return font_name if "Bold" in font_name else f"{font_name.split('-')[0]}-Bold"
+
+
+def parse_runs(text, font_name):
+    """Split paragraph markup into (text, font) runs, honouring <b> only"""
+    runs = []
+    bold = 0
+    pos = 0
+    for match in _TAG_RE.finditer(text):
+        if match.start() > pos:
+            font = _bold_font(font_name) if bold else font_name
+            runs.append((unescape(text[pos : match.start()]), font))
+        if match.group(2).lower() == "b":
+            bold += -1 if match.group(1) else 1
+        pos = match.end()
+    if pos < len(text):
+        runs.append(
+            (unescape(text[pos:]), _bold_font(font_name) if bold else font_name)
+        )
+    return runs
+
+
+def _words(runs):
+    """Yield (word, font, preceded by whitespace) for every word in runs"""
+    spaced = False
+    for text, font in runs:
+        for index, word in enumerate(_SPACE_RE.split(text)):
+            spaced = spaced or index > 0
+            if word:
+                yield word, font, spaced
+                spaced = False
+
+
+def _split_word(word, font, font_size, available, width):
+    """Split an overlong word into pieces filling available, then whole lines"""
+    pieces = []
+    piece = ""
+    piece_width = 0
+    for char in word:
+        char_width = string_width(char, font, font_size)
+        if piece_width + char_width > available:
+            pieces.append(piece)
+            piece, piece_width, available = "", 0, width
+        piece += char
+        piece_width += char_width
+    pieces.append(piece)
+    return pieces
+
+
+def break_lines(runs, font_size, first_width, width):
+    """Greedily break runs into lines of (text, font, width) fragments
+
+    Like platypus, a line may overrun its width by SPACE_SHRINKAGE of each
+    space; such lines are drawn with their word spacing compressed. A word
+    wider than a whole line is split across lines, as splitLongWords does.
+    """
+    lines = []
+    line = []
+    line_width = 0
+    spaces = 0
+    max_width = first_width
+    space_widths = {}
+
+    def add(text, font, text_width):
+        # Merge consecutive words in the same font into one fragment
+        if line and line[-1][1] == font:
+            fragment_text, _, fragment_width = line[-1]
+            line[-1] = (fragment_text + text, font, fragment_width + text_width)
+        else:
+            line.append((text, font, text_width))
+
+    for word, font, spaced in _words(runs):
+        text = word
+        word_width = string_width(word, font, font_size)
+        space_width = space_widths.get(font)
+        if space_width is None:
+            space_width = space_widths[font] = string_width(" ", font, font_size)
+
+        if word_width > max_width:
+            # Fill the rest of this line, then whole lines; only the last
+            # piece stays open for the words that follow
+            prefix = " " if spaced and line else ""
+            available = max_width - line_width - (space_width if prefix else 0)
+            pieces = _split_word(word, font, font_size, available, width)
+            for index, piece in enumerate(pieces):
+                text = (prefix if index == 0 else "") + piece
+                text_width = string_width(text, font, font_size)
+                add(text, font, text_width)
+                line_width += text_width
+                if index < len(pieces) - 1:
+                    lines.append(line)
+                    line, line_width, spaces, max_width = [], 0, 0, width
+            continue
+
+        if spaced and line:
+            text = " " + word
+            word_width += space_width
+            limit = max_width + SPACE_SHRINKAGE * space_width * (spaces + 1)
+            if line_width + word_width > limit:
+                lines.append(line)
+                line, line_width, spaces, max_width = [], 0, 0, width
+                text = word
+                word_width -= space_width
+            else:
+                spaces += 1
+
+        add(text, font, word_width)
+        line_width += word_width
+    if line:
+        lines.append(line)
+    return lines
+
+
+class CanvasRenderer:
+    """Render a ResumeGenerator's data directly onto a Canvas"""
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.data = generator.data
+        self.styles = generator.styles
+        self.scale = generator.scale
+        self.use_forms = generator.use_forms
+        margins = generator.layout_config()["margins"]
+        self.left = margins["leftMargin"] + FRAME_PADDING
+        self.width = letter[0] - self.left - margins["rightMargin"] - FRAME_PADDING
+        self.top = letter[1] - margins["topMargin"] - FRAME_PADDING
+        self.bottom = margins["bottomMargin"] + FRAME_PADDING
+
+    def render_to(self, stream):
+        """Render the resume PDF into a file path or writable file object"""
+        self.canvas = Canvas(stream, pagesize=letter)
+        self.y = self.top
+        self.prev_space_after = None
+
+        self.draw_personal_section()
+        self.draw_experience_section()
+        self.draw_education_section()
+        self.draw_skills_section()
+        self.draw_certifications_section()
+        self.draw_projects_section()
+
+        self.canvas.showPage()
+        self.canvas.save()
+
+    # Layout primitives
+
+    def _place(self, height, space_before=0):
+        """Reserve height below the cursor, starting a new page if needed"""
+        gap = 0
+        if self.prev_space_after is not None:
+            gap = max(space_before, self.prev_space_after)
+        if self.y - gap - height < self.bottom and self.y < self.top:
+            self._new_page()
+            gap = 0
+        self.y -= gap + height
+        return self.y
+
+    def _new_page(self):
+        """Finish the current page and move the cursor to the next frame top"""
+        self.canvas.showPage()
+        self.y = self.top
+        self.prev_space_after = None
+
+    def space(self, height):
+        """Vertical space of height inches, like a Spacer"""
+        self._place(height * inch * self.scale)
+        self.prev_space_after = 0
+
+    def paragraph(self, text, style):
+        """Draw markup text wrapped to the frame width with style's indents"""
+        font_size = style.fontSize
+        first_indent = style.leftIndent + style.firstLineIndent
+        lines = break_lines(
+            parse_runs(text, style.fontName),
+            font_size,
+            self.width - first_indent,
+            self.width - style.leftIndent,
+        )
+
+        self.canvas.setFillColor(style.textColor)
+        space_before = style.spaceBefore
+        if not style.allowOrphans and len(lines) > 1 and self.y < self.top:
+            # Never leave the first line of a paragraph alone at a page bottom
+            gap = max(space_before, self.prev_space_after or 0)
+            if self.y - gap - 2 * style.leading < self.bottom:
+                self._new_page()
+        for index, line in enumerate(lines):
+            bottom = self._place(style.leading, space_before)
+            space_before = 0
+            self.prev_space_after = 0
+
+            indent = first_indent if index == 0 else style.leftIndent
+            max_width = self.width - indent
+            line_width = sum(width for _, _, width in line)
+            if style.alignment == TA_CENTER:
+                x = self.left + (self.width - line_width) / 2
+            else:
+                x = self.left + indent
+
+            text = self.canvas.beginText(x, bottom + style.leading - font_size)
+            spaces = sum(text_run.count(" ") for text_run, _, _ in line)
+            # Compress the word spacing of lines allowed to overrun; a lone
+            # overlong word (e.g. a URL) has no spaces and simply overruns
+            squeeze = line_width > max_width and spaces > 0
+            if squeeze:
+                text.setWordSpace((max_width - line_width) / spaces)
+            for text_run, font, _ in line:
+                text.setFont(font, font_size)
+                text.textOut(text_run)
+            if squeeze:
+                # Word spacing is graphics state and would leak into later text
+                text.setWordSpace(0)
+            self.canvas.drawText(text)
+        self.prev_space_after = style.spaceAfter
+
+    def two_column(self, left_text, right_text, left_style, right_style):
+        """Draw left and right aligned text on the same line"""
+        y = self._place(14 * self.scale)
+        self.prev_space_after = 0
+
+        self.canvas.setFont(left_style["fontName"], left_style["fontSize"])
+        self.canvas.setFillColor(left_style.get("textColor", black))
+        self.canvas.drawString(self.left, y, left_text)
+
+        right_width = string_width(
+            right_text, right_style["fontName"], right_style["fontSize"]
+        )
+        self.canvas.setFont(right_style["fontName"], right_style["fontSize"])
+        self.canvas.setFillColor(right_style.get("textColor", black))
+        self.canvas.drawString(self.left + self.width - right_width, y, right_text)
+
+    def rule(self):
+        """Horizontal rule across the frame, like the section HRFlowable"""
+        y = self._place(0.5, space_before=1)
+        self.prev_space_after = 1
+        if not self.use_forms:
+            self.canvas.setLineWidth(0.5)
+            self.canvas.setStrokeColor(black)
+            self.canvas.line(self.left, y, self.left + self.width, y)
+            return
+
+        if not self.canvas.hasForm("SectionRule"):
+            self.canvas.beginForm("SectionRule", -2, -2, self.width + 2, 2)
+            self.canvas.saveState()
+            self.canvas.setLineWidth(0.5)
+            self.canvas.setStrokeColor(black)
+            self.canvas.line(0, 0, self.width, 0)
+            self.canvas.restoreState()
+            self.canvas.endForm()
+        self.canvas.saveState()
+        self.canvas.translate(self.left, y)
+        self.canvas.doForm("SectionRule")
+        self.canvas.restoreState()
+
+    def section_header(self, title, separator=True):
+        self.paragraph(title, self.styles["SectionHeader"])
+        if separator:
+            self.rule()
+            self.space(0.08)
+
+    # Sections, mirroring ResumeGenerator.create_*_section
+
+    def draw_personal_section(self):
+        if "personal" not in self.data:
+            return
+
+        personal = self.data["personal"]
+        if "name" in personal:
+            self.paragraph(personal["name"], self.styles["Name"])
+
+        contact_info = [
+            personal[key]
+            for key in ("email", "phone", "location", "linkedin", "github", "website")
+            if key in personal
+        ]
+        if contact_info:
+            self.paragraph(" • ".join(contact_info), self.styles["Contact"])
+
+        self.space(0.03)
+
+    def draw_experience_section(self):
+        if "experience" not in self.data or not self.data["experience"]:
+            return
+
+        self.section_header("PROFESSIONAL EXPERIENCE")
+        for exp in self.data["experience"]:
+            if "company" in exp and "location" in exp:
+                self.two_column(
+                    exp["company"],
+                    exp["location"],
+                    self._line_style("Helvetica-Bold", 12),
+                    self._line_style("Helvetica", 11),
+                )
+                self.space(0.02)
+
+            if "title" in exp and "duration" in exp:
+                self.two_column(
+                    exp["title"],
+                    exp["duration"],
+                    self._line_style("Helvetica-Oblique", 11),
+                    self._line_style("Helvetica-Oblique", 11, grey),
+                )
+                self.space(0.04)
+
+            for responsibility in map(item_text, exp.get("responsibilities", ())):
+                self.paragraph(f"- {responsibility}", self.styles["BulletPoint"])
+
+            self.space(0.05)
+
+    def draw_education_section(self):
+        if "education" not in self.data or not self.data["education"]:
+            return
+
+        self.section_header("EDUCATION")
+        for edu in self.data["education"]:
+            if "institution" in edu and "location" in edu:
+                self.two_column(
+                    edu["institution"],
+                    edu["location"],
+                    self._line_style("Helvetica-Bold", 12),
+                    self._line_style("Helvetica", 11),
+                )
+                self.space(0.02)
+
+            if "degree" in edu and "duration" in edu:
+                self.two_column(
+                    edu["degree"],
+                    edu["duration"],
+                    self._line_style("Helvetica-Oblique", 11),
+                    self._line_style("Helvetica-Oblique", 11, grey),
+                )
+                self.space(0.05)
+
+    def draw_skills_section(self):
+        if "skills" not in self.data or not self.data["skills"]:
+            return
+
+        self.section_header("TECHNICAL SKILLS")
+        skills_text = ", ".join(map(item_text, self.data["skills"]))
+        self.paragraph(skills_text, self.styles["Description"])
+        self.space(0.1)
+
+    def draw_certifications_section(self):
+        if "certifications" not in self.data or not self.data["certifications"]:
+            return
+
+        self.section_header("CERTIFICATIONS")
+        for cert in self.data["certifications"]:
+            self.paragraph(f"• {cert}", self.styles["Description"])
+
+    def draw_projects_section(self):
+        if "projects" not in self.data or not self.data["projects"]:
+            return
+
+        self.section_header("PROJECTS", separator=False)
+        for project in self.data["projects"]:
+            if "name" in project:
+                self.paragraph(f"<b>{project['name']}</b>", self.styles["JobTitle"])
+            if "description" in project:
+                self.paragraph(project["description"], self.styles["Description"])
+            if "technologies" in project:
+                self.paragraph(
+                    f"<b>Technologies:</b> {project['technologies']}",
+                    self.styles["Description"],
+                )
+            if "link" in project:
+                self.paragraph(
+                    f"<b>Link:</b> {project['link']}", self.styles["Description"]
+                )
+            self.space(0.1)
+
+    def _line_style(self, font_name, font_size, color=black):
+        return {
+            "fontName": font_name,
+            "fontSize": font_size * self.scale,
+            "textColor": color,
+        }
@@ -0,0 +1,42 @@
+"""
+Font Metric Cache
+Process-wide memoized string widths shared by every layout path
+"""
+
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+
+# Distinct (text, font, size) entries kept before least recently used eviction
+WIDTH_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def string_width(text, font_name, font_size, encoding="utf8"):
+    """Width of text in points, memoized on (text, font, size)"""
+    return pdfmetrics.stringWidth(text, font_name, font_size, encoding)
+
+
+def width_cache_stats():
+    """Return hit/miss counters and occupancy of the width cache"""
+    info = string_width.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+    }
+
+
+def install_paragraph_width_cache():
+    """Route platypus Paragraph word measurement through the width cache
+
+    Paragraph wrapping measures every word through the stringWidth imported
+    into reportlab.platypus.paragraph, so rebinding that name lets bullet,
+    skills and description paragraphs share the cache. Safe to call repeatedly.
+    """
+    from reportlab.platypus import paragraph
+
+    paragraph.stringWidth = string_width
@@ -2,435 +2,535 @@
 """
 Dynamic Resume Generator
 Generates a professional resume PDF from structured data in input.txt
+
+Only the standard library is imported up front; reportlab and yaml load when a
+command actually needs them, keeping --help and input validation fast.
 """
 
+import argparse
 import sys
-import yaml
-from pathlib import Path
-
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.colors import black, darkblue, grey
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    Table,
-    TableStyle,
-    HRFlowable,
-    Flowable,
-)
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
-
-
-class TwoColumnLine(Flowable):
-    """Custom flowable for left-right aligned text on the same line"""
-
-    def __init__(self, left_text, right_text, left_style, right_style):
-        self.left_text = left_text
-        self.right_text = right_text
-        self.left_style = left_style
-        self.right_style = right_style
 
-    def draw(self):
-        canvas = self.canv
 
-        # Draw left text at x=0
-        canvas.setFont(self.left_style["fontName"], self.left_style["fontSize"])
-        canvas.setFillColor(self.left_style.get("textColor", black))
-        canvas.drawString(0, 0, self.left_text)
+def __getattr__(name):
+    """Lazily re-export the generator API, e.g. ``from main import ResumeGenerator``"""
+    import resume_generator
 
-        # Calculate right text position using the actual available width
-        right_text_width = canvas.stringWidth(
-            self.right_text, self.right_style["fontName"], self.right_style["fontSize"]
-        )
-        right_x = self.width - right_text_width
-
-        # Draw right text
-        canvas.setFont(self.right_style["fontName"], self.right_style["fontSize"])
-        canvas.setFillColor(self.right_style.get("textColor", black))
-        canvas.drawString(right_x, 0, self.right_text)
-
-    def wrap(self, availWidth, availHeight):
-        # Use the actual available width provided by ReportLab
-        self.width = availWidth
-        return (availWidth, 14)  # 14 points height for text
-
-
-class ResumeGenerator:
-    """Generate professional resume PDF from structured input data"""
-
-    def __init__(
-        self, input_file="resume_data.yaml", output_file="Narayan, Sarthak - Resume.pdf"
-    ):
-        self.input_file = input_file
-        self.output_file = output_file
-        self.data = {}
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom styles for the resume"""
-        # Name style
-        self.styles.add(
-            ParagraphStyle(
-                name="Name",
-                parent=self.styles["Heading1"],
-                fontSize=20,
-                textColor=darkblue,
-                spaceAfter=6,
-                alignment=TA_CENTER,
-                fontName="Helvetica-Bold",
-            )
-        )
+    try:
+        return getattr(resume_generator, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def add_cache_arguments(parser):
+    """Add the rendered-output cache options to a parser"""
+    parser.add_argument(
+        "--cache-dir", default=None, help="Reuse rendered PDFs cached in this directory"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=512,
+        help="Evict least recently used cache entries beyond this size",
+    )
+
+
+def open_cache(args):
+    """Open the render cache requested on the command line, if any"""
+    if not args.cache_dir:
+        return None
+
+    from cache import RenderCache
+
+    return RenderCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024))
+
+
+# Global rendering options, and the subset each subcommand actually honours
+RENDER_OPTIONS = (
+    "snapshot_dir",
+    "profile",
+    "cprofile",
+    "fit_pages",
+    "engine",
+    "watch",
+    "forms",
+    "verify",
+    "max_pages",
+    "cache_dir",
+    "cache_max_mb",
+)
+SUBCOMMAND_OPTIONS = {
+    "batch": {
+        "snapshot_dir",
+        "profile",
+        "engine",
+        "forms",
+        "verify",
+        "max_pages",
+        "cache_dir",
+        "cache_max_mb",
+    },
+    "stream": {"forms", "cache_dir", "cache_max_mb"},
+    "variants": {"fit_pages", "engine", "forms"},
+    "tailor": {"fit_pages", "engine", "forms"},
+    "serve": set(),
+}
+
+
+def build_parser():
+    """Build the command line argument parser"""
+    parser = argparse.ArgumentParser(description="Dynamic Resume Generator")
+    parser.add_argument(
+        "-i", "--input", default="resume_data.yaml", help="Input YAML file"
+    )
+    parser.add_argument(
+        "-o", "--output", default="Narayan, Sarthak - Resume.pdf", help="Output PDF"
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        default=None,
+        help="Store compiled JSON snapshots of parsed YAML inputs in this directory",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report wall/CPU time per phase and write <output>.timings.json",
+    )
+    parser.add_argument(
+        "--cprofile", default=None, help="Dump cProfile statistics to this file"
+    )
+    parser.add_argument(
+        "--fit-pages",
+        type=int,
+        default=None,
+        help="Shrink fonts and spacing until the resume fits this many pages",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=("platypus", "canvas"),
+        default="platypus",
+        help="Layout engine: platypus flowables or the direct canvas fast path",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-render whenever the input file changes",
+    )
+    parser.add_argument(
+        "--forms",
+        action="store_true",
+        help="Draw repeated elements such as section rules as PDF form XObjects",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check generated PDFs with pdfplumber against the input data",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=None,
+        help="Reject resumes predicted to exceed this many pages before "
+        "rendering them; with --verify, also check the rendered PDF",
+    )
+    add_cache_arguments(parser)
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch = subparsers.add_parser(
+        "batch", help="Render many resumes in parallel with a process pool"
+    )
+    batch.add_argument(
+        "sources",
+        nargs="+",
+        help="Directories of YAML files, YAML files, or manifest files listing them",
+    )
+    batch.add_argument(
+        "-d", "--output-dir", default="output", help="Directory for generated PDFs"
+    )
+    batch.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    batch.add_argument(
+        "--start-method",
+        choices=("fork", "spawn", "forkserver"),
+        default=None,
+        help="How workers start (default: the platform's); fork shares the "
+        "parent's preloaded ReportLab state copy-on-write",
+    )
+
+    stream = subparsers.add_parser(
+        "stream",
+        help="Render one PDF per document of a multi-document YAML stream",
+    )
+    stream.add_argument("stream_input", help="YAML file with '---' separated resumes")
+    stream.add_argument(
+        "-d", "--output-dir", default="output", help="Directory for generated PDFs"
+    )
+
+    variants = subparsers.add_parser(
+        "variants",
+        help="Render every tagged variant declared in the input file in parallel",
+    )
+    variants.add_argument(
+        "-d", "--output-dir", default="output", help="Directory for generated PDFs"
+    )
+    variants.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    variants.add_argument(
+        "--overlay",
+        action="store_true",
+        help="Render the shared personal header once and stamp it onto each "
+        "variant's body",
+    )
+
+    tailor = subparsers.add_parser(
+        "tailor",
+        help="Render a resume tailored to each job description by keyword match",
+    )
+    tailor.add_argument(
+        "job_descriptions", nargs="+", help="Job description text files"
+    )
+    tailor.add_argument(
+        "-d", "--output-dir", default="output", help="Directory for generated PDFs"
+    )
+    tailor.add_argument(
+        "--max-bullets", type=int, default=None, help="Total bullet budget"
+    )
+    tailor.add_argument(
+        "--max-chars", type=int, default=None, help="Total bullet text budget"
+    )
+    tailor.add_argument(
+        "--max-skills", type=int, default=None, help="Number of skills to keep"
+    )
+    tailor.add_argument(
+        "--knapsack-pages",
+        type=int,
+        default=None,
+        help="Pick the highest-scoring bullets that fit this many pages",
+    )
+    tailor.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+
+    serve = subparsers.add_parser(
+        "serve", help="Run a local HTTP server that renders resume payloads"
+    )
+    serve.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    serve.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    serve.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum renders in flight before requests are rejected",
+    )
+    serve.add_argument("-v", "--verbose", action="store_true", help="Log requests")
+
+    return parser
+
+
+def run_batch_command(args):
+    """Render a batch of resumes and print a throughput summary"""
+    from batch import run_batch
 
-        # Contact info style
-        self.styles.add(
-            ParagraphStyle(
-                name="Contact",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=black,
-                spaceAfter=6,
-                alignment=TA_CENTER,
-                fontName="Helvetica",
-            )
+    try:
+        result = run_batch(
+            args.sources,
+            args.output_dir,
+            workers=args.workers,
+            snapshot_dir=args.snapshot_dir,
+            engine=args.engine,
+            profile=args.profile,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=int(args.cache_max_mb * 1024 * 1024),
+            verify=args.verify,
+            max_pages=args.max_pages,
+            start_method=args.start_method,
+            forms=args.forms,
         )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    for path, error in result.failed:
+        print(f"Error generating {path}: {error}")
+    for path, problems in result.unverified:
+        print(f"Verification failed for {path}: {'; '.join(problems)}")
+    print(result.summary())
+    return 1 if result.failed or result.unverified else 0
 
-        # Section header style
-        self.styles.add(
-            ParagraphStyle(
-                name="SectionHeader",
-                parent=self.styles["Heading2"],
-                fontSize=14,
-                textColor=black,
-                spaceBefore=8,
-                spaceAfter=1,
-                fontName="Helvetica-Bold",
-            )
-        )
 
-        # Job title style
-        self.styles.add(
-            ParagraphStyle(
-                name="JobTitle",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=black,
-                fontName="Helvetica-Bold",
-                spaceAfter=2,
-            )
-        )
+def run_stream_command(args):
+    """Render each document of a YAML stream as soon as it is parsed"""
+    from batch import render_stream
 
-        # Company style
-        self.styles.add(
-            ParagraphStyle(
-                name="Company",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=black,
-                fontName="Helvetica-Bold",
-                spaceAfter=2,
-            )
-        )
+    count = failed = 0
+    try:
+        for output_file, error in render_stream(
+            args.stream_input,
+            args.output_dir,
+            cache=open_cache(args),
+            forms=args.forms,
+        ):
+            count += 1
+            if error:
+                failed += 1
+                print(f"Error generating resume {count}: {error}")
+            else:
+                print(f"Resume generated successfully: {output_file}")
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return 1
+    except Exception as e:
+        # Unparseable YAML ends the stream; nothing after it can be read
+        print(f"Error reading resume {count + 1}: {e}")
+        return 1
+    print(f"Rendered {count - failed} of {count} resumes from {args.stream_input}")
+    return 1 if failed else 0
 
-        # Date/Location style
-        self.styles.add(
-            ParagraphStyle(
-                name="DateLocation",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=grey,
-                fontName="Helvetica-Oblique",
-                spaceAfter=4,
-            )
-        )
 
-        # Description style (for regular text like skills)
-        self.styles.add(
-            ParagraphStyle(
-                name="Description",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=black,
-                fontName="Helvetica",
-                leftIndent=0,
-                spaceAfter=2,
-            )
-        )
+def run_variants_command(args):
+    """Render all variants of the input resume and report each output"""
+    from variants import render_variants
 
-        # Bullet point style with hanging indent
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-
-        dash_space_width = stringWidth("- ", "Helvetica", 11)
-
-        self.styles.add(
-            ParagraphStyle(
-                name="BulletPoint",
-                parent=self.styles["Normal"],
-                fontSize=11,
-                textColor=black,
-                fontName="Helvetica",
-                leftIndent=dash_space_width,  # Exact width of "- " in this font/size
-                firstLineIndent=-dash_space_width,  # Pull first line back to margin
-                spaceAfter=2,
-            )
+    try:
+        results = render_variants(
+            args.input,
+            args.output_dir,
+            workers=args.workers,
+            engine=args.engine,
+            fit_pages=args.fit_pages,
+            overlay=args.overlay,
+            forms=args.forms,
         )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
 
-    def parse_input_file(self):
-        """Parse the YAML file and extract structured data"""
-        if not Path(self.input_file).exists():
-            raise FileNotFoundError(f"Input file {self.input_file} not found!")
-
-        with open(self.input_file, "r", encoding="utf-8") as f:
-            self.data = yaml.safe_load(f)
+    for name, output_file, error in results:
+        if error:
+            print(f"Error generating variant {name}: {error}")
+        else:
+            print(f"Resume generated successfully: {output_file}")
+    if not results:
+        print(f"No variants declared in {args.input}")
+    return 1 if any(error for _, _, error in results) else 0
 
-    def add_section_separator(self, story):
-        """Add a horizontal line separator after section heading"""
-        # story.append(Spacer(1, 0.02 * inch))
-        story.append(HRFlowable(width="100%", thickness=0.5, color=black))
-        story.append(Spacer(1, 0.08 * inch))
 
-    def create_personal_section(self, story):
-        """Create the personal information section"""
-        if "personal" not in self.data:
-            return
+def run_tailor_command(args):
+    """Render one tailored resume per job description"""
+    from concurrent.futures import as_completed
+    from pathlib import Path
 
-        personal = self.data["personal"]
-
-        # Name
-        if "name" in personal:
-            name = Paragraph(personal["name"], self.styles["Name"])
-            story.append(name)
-
-        # Contact information
-        contact_info = []
-        if "email" in personal:
-            contact_info.append(personal["email"])
-        if "phone" in personal:
-            contact_info.append(personal["phone"])
-        if "location" in personal:
-            contact_info.append(personal["location"])
-        if "linkedin" in personal:
-            contact_info.append(personal["linkedin"])
-        if "github" in personal:
-            contact_info.append(personal["github"])
-        if "website" in personal:
-            contact_info.append(personal["website"])
-
-        if contact_info:
-            contact_text = " • ".join(contact_info)
-            contact = Paragraph(contact_text, self.styles["Contact"])
-            story.append(contact)
-
-        story.append(Spacer(1, 0.03 * inch))
-
-    def create_experience_section(self, story):
-        """Create the experience section"""
-        if "experience" not in self.data or not self.data["experience"]:
-            return
+    from batch import worker_pool
+    from resume_generator import ResumeGenerator
+    from schema import ResumeValidationError
+    from tailor import BulletIndex
+    from variants import render_variant
 
-        story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles["SectionHeader"]))
-        self.add_section_separator(story)
-
-        for exp in self.data["experience"]:
-            # Company (left) - Location (right) line
-            if "company" in exp and "location" in exp:
-                company_location_line = TwoColumnLine(
-                    left_text=exp["company"],
-                    right_text=exp["location"],
-                    left_style={
-                        "fontName": "Helvetica-Bold",
-                        "fontSize": 12,
-                        "textColor": black,
-                    },
-                    right_style={
-                        "fontName": "Helvetica",
-                        "fontSize": 11,
-                        "textColor": black,
-                    },
-                )
-                story.append(company_location_line)
-                story.append(Spacer(1, 0.02 * inch))
-
-            # Title (left) - Date (right) line
-            if "title" in exp and "duration" in exp:
-                title_date_line = TwoColumnLine(
-                    left_text=exp["title"],
-                    right_text=exp["duration"],
-                    left_style={
-                        "fontName": "Helvetica-Oblique",
-                        "fontSize": 11,
-                        "textColor": black,
-                    },
-                    right_style={
-                        "fontName": "Helvetica-Oblique",
-                        "fontSize": 11,
-                        "textColor": grey,
-                    },
-                )
-                story.append(title_date_line)
-                story.append(Spacer(1, 0.04 * inch))
-
-            # Responsibilities
-            if "responsibilities" in exp:
-                for responsibility in exp["responsibilities"]:
-                    description = Paragraph(
-                        f"- {responsibility}", self.styles["BulletPoint"]
-                    )
-                    story.append(description)
-
-            story.append(Spacer(1, 0.05 * inch))
-
-    def create_education_section(self, story):
-        """Create the education section"""
-        if "education" not in self.data or not self.data["education"]:
-            return
+    generator = ResumeGenerator(args.input)
+    try:
+        generator.parse_input_file()
+        generator.validate()
+    except (FileNotFoundError, ResumeValidationError) as e:
+        print(f"Error: {e}")
+        return 1
 
-        story.append(Paragraph("EDUCATION", self.styles["SectionHeader"]))
-        self.add_section_separator(story)
-
-        for edu in self.data["education"]:
-            # Institution (left) - Duration (right) line
-            if "institution" in edu and "duration" in edu:
-                institution_duration_line = TwoColumnLine(
-                    left_text=edu["institution"],
-                    right_text=edu["location"],
-                    left_style={
-                        "fontName": "Helvetica-Bold",
-                        "fontSize": 12,
-                        "textColor": black,
-                    },
-                    right_style={
-                        "fontName": "Helvetica",
-                        "fontSize": 11,
-                        "textColor": black,
-                    },
-                )
-                story.append(institution_duration_line)
-                story.append(Spacer(1, 0.02 * inch))
-
-            # Degree (left) - Location (right) line
-            if "degree" in edu and "duration" in edu:
-                degree_location_line = TwoColumnLine(
-                    left_text=edu["degree"],
-                    right_text=edu["duration"],
-                    left_style={
-                        "fontName": "Helvetica-Oblique",
-                        "fontSize": 11,
-                        "textColor": black,
-                    },
-                    right_style={
-                        "fontName": "Helvetica-Oblique",
-                        "fontSize": 11,
-                        "textColor": grey,
-                    },
+    # Two job descriptions with the same file name would write the same PDF
+    outputs = {}
+    for job_description in args.job_descriptions:
+        name = f"{Path(job_description).stem}.pdf"
+        if name in outputs:
+            print(
+                f"Error: {outputs[name]} and {job_description} "
+                f"would both render to {name}"
+            )
+            return 1
+        outputs[name] = job_description
+
+    # The index is built once and queried for every job description
+    index = BulletIndex(generator.data)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    failed = 0
+    with worker_pool(args.workers) as pool:
+        futures = {}
+        for job_description in args.job_descriptions:
+            try:
+                with open(job_description, "r", encoding="utf-8") as f:
+                    text = f.read()
+            except OSError as e:
+                failed += 1
+                print(f"Error reading {job_description}: {e}")
+                continue
+            if args.knapsack_pages:
+                try:
+                    data = index.fit(text, args.knapsack_pages, args.max_skills)
+                except ValueError as e:
+                    failed += 1
+                    print(f"Error tailoring {job_description}: {e}")
+                    continue
+            else:
+                data = index.tailor(
+                    text, args.max_bullets, args.max_chars, args.max_skills
                 )
-                story.append(degree_location_line)
-                story.append(Spacer(1, 0.05 * inch))
-
-    def create_skills_section(self, story):
-        """Create the skills section"""
-        if "skills" not in self.data or not self.data["skills"]:
-            return
-
-        story.append(Paragraph("TECHNICAL SKILLS", self.styles["SectionHeader"]))
-        self.add_section_separator(story)
-
-        # Handle simple list of skills
-        skills_text = ", ".join(self.data["skills"])
-        skills_para = Paragraph(skills_text, self.styles["Description"])
-        story.append(skills_para)
-
-        story.append(Spacer(1, 0.1 * inch))
-
-    def create_certifications_section(self, story):
-        """Create the certifications section"""
-        if "certifications" not in self.data or not self.data["certifications"]:
-            return
-
-        story.append(Paragraph("CERTIFICATIONS", self.styles["SectionHeader"]))
-        self.add_section_separator(story)
-
-        for cert in self.data["certifications"]:
-            cert_para = Paragraph(f"• {cert}", self.styles["Description"])
-            story.append(cert_para)
-
-    def create_projects_section(self, story):
-        """Create the projects section"""
-        if "projects" not in self.data or not self.data["projects"]:
+            output_file = output_dir / f"{Path(job_description).stem}.pdf"
+            future = pool.submit(
+                render_variant,
+                data,
+                output_file,
+                args.engine,
+                args.fit_pages,
+                forms=args.forms,
+            )
+            futures[future] = output_file
+        for future in as_completed(futures):
+            error, _ = future.result()
+            if error:
+                failed += 1
+                print(f"Error generating {futures[future]}: {error}")
+            else:
+                print(f"Resume generated successfully: {futures[future]}")
+    return 1 if failed else 0
+
+
+def verify_output(args, data):
+    """Check the rendered output against data, printing any problems"""
+    from verify import verify_pdf
+
+    problems = verify_pdf(args.output, data, args.max_pages)
+    for problem in problems:
+        print(f"Verification failed: {problem}")
+    if not problems:
+        print("Verification passed")
+    return not problems
+
+
+def run_watch_command(args, generator, cache):
+    """Re-render with the warm generator every time the input file is saved"""
+    import os
+    import time
+
+    from watch import watch_file
+
+    def render():
+        hits = generator.section_cache.hits if generator.section_cache else 0
+        start = time.perf_counter()
+        try:
+            generator.parse_input_file()
+            generator.validate()
+            generator.generate_pdf(
+                verbose=False,
+                cache=cache,
+                fit_pages=args.fit_pages,
+                max_pages=args.max_pages,
+            )
+        except Exception as e:
+            print(f"Error generating resume: {e}")
             return
-
-        story.append(Paragraph("PROJECTS", self.styles["SectionHeader"]))
-
-        for project in self.data["projects"]:
-            # Project name
-            if "name" in project:
-                name = Paragraph(f"<b>{project['name']}</b>", self.styles["JobTitle"])
-                story.append(name)
-
-            # Description
-            if "description" in project:
-                desc = Paragraph(project["description"], self.styles["Description"])
-                story.append(desc)
-
-            # Technologies
-            if "technologies" in project:
-                tech = Paragraph(
-                    f"<b>Technologies:</b> {project['technologies']}",
-                    self.styles["Description"],
-                )
-                story.append(tech)
-
-            # Link
-            if "link" in project:
-                link = Paragraph(
-                    f"<b>Link:</b> {project['link']}", self.styles["Description"]
-                )
-                story.append(link)
-
-            story.append(Spacer(1, 0.1 * inch))
-
-    def generate_pdf(self):
-        """Generate the complete resume PDF"""
-        doc = SimpleDocTemplate(
-            self.output_file,
-            pagesize=letter,
-            rightMargin=0.4 * inch,
-            leftMargin=0.4 * inch,
-            topMargin=0.3 * inch,
-            bottomMargin=0.3 * inch,
+        elapsed = (time.perf_counter() - start) * 1000
+        since_save = (time.time() - os.stat(args.input).st_mtime) * 1000
+        reused = generator.section_cache.hits - hits if generator.section_cache else 0
+        print(
+            f"Resume regenerated: {args.output} "
+            f"(render {elapsed:.0f} ms, {since_save:.0f} ms after save, "
+            f"{reused} section(s) reused)"
         )
+        if args.verify:
+            verify_output(args, generator.data)
 
-        story = []
-
-        # Build the resume sections
-        self.create_personal_section(story)
-        self.create_experience_section(story)
-        self.create_education_section(story)
-        self.create_skills_section(story)
-        self.create_certifications_section(story)
-        self.create_projects_section(story)
-
-        # Build PDF
-        doc.build(story)
-        print(f"Resume generated successfully: {self.output_file}")
+    print(f"Watching {args.input} for changes (Ctrl+C to stop)...")
+    watch_file(args.input, render)
+    return 0
 
 
-def main():
+def main(argv=None):
     """Main function to generate resume"""
-    generator = ResumeGenerator()
-
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # Reject global options a subcommand would otherwise silently ignore
+    if args.command:
+        for dest in RENDER_OPTIONS:
+            if dest in SUBCOMMAND_OPTIONS[args.command]:
+                continue
+            if getattr(args, dest) != parser.get_default(dest):
+                option = "--" + dest.replace("_", "-")
+                parser.error(f"{option} is not supported by {args.command}")
+
+    if args.command == "batch":
+        return run_batch_command(args)
+    if args.command == "stream":
+        return run_stream_command(args)
+    if args.command == "variants":
+        return run_variants_command(args)
+    if args.command == "tailor":
+        return run_tailor_command(args)
+    if args.command == "serve":
+        from server import serve
+
+        return serve(args.host, args.port, args.max_concurrency, args.verbose)
+
+    # Deferred so --help and non-render commands never load reportlab
+    from resume_generator import ResumeGenerator
+
+    generator = ResumeGenerator(args.input, args.output, args.snapshot_dir)
+    generator.engine = args.engine
+    generator.use_forms = args.forms
+    cache = open_cache(args)
+    if args.profile:
+        from profiling import PhaseTimer
+
+        generator.timer = PhaseTimer()
+    if args.cprofile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    status = 0
     try:
         print("Parsing input data...")
         generator.parse_input_file()
+        generator.validate()
 
         print("Generating PDF...")
-        generator.generate_pdf()
+        # A cheap wrap-only estimate rejects oversize resumes before they are
+        # serialized, after fitting when --fit-pages is also given
+        generator.generate_pdf(
+            cache=cache, fit_pages=args.fit_pages, max_pages=args.max_pages
+        )
+        if generator.scale != 1.0:
+            print(
+                f"Scaled layout to {generator.scale:.3f} "
+                f"to fit {args.fit_pages} page(s)"
+            )
 
         print("Resume generation completed successfully!")
+        if args.verify and not verify_output(args, generator.data):
+            status = 1
+        if args.cprofile:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
+            print(f"cProfile statistics written to {args.cprofile}")
+        if generator.timer is not None:
+            report_file = f"{args.output}.timings.json"
+            generator.timer.write_report(report_file, input=args.input)
+            print(generator.timer.format_table())
+            print(f"Timing report written to {report_file}")
+        if cache is not None:
+            stats = cache.stats()
+            print(f"Cache: {stats['hits']} hit(s), {stats['misses']} miss(es)")
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -438,9 +538,12 @@ def main():
         return 1
     except Exception as e:
         print(f"Error generating resume: {e}")
-        return 1
+        if not args.watch:
+            return 1
 
-    return 0
+    if args.watch:
+        return run_watch_command(args, generator, cache)
+    return status
 
 
 if __name__ == "__main__":
@@ -0,0 +1,160 @@
+"""
+Template-and-Overlay Rendering
+Prerenders the personal header once as a PDF template, then produces each
+resume by laying out only the body below it and stamping the template onto
+the first page with PyPDF2
+"""
+
+from io import BytesIO
+
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, DictionaryObject, NameObject
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate
+
+from resume_generator import FRAME_SIZE, PAGE_MARGINS, ResumeGenerator
+
+# The header is drawn inside this form, which ReportLab names FormXob.<name>
+HEADER_FORM = "StaticHeader"
+HEADER_XOBJECT = f"/FormXob.{HEADER_FORM}"
+
+# Template PDF bytes -> parsed header page; per process, and inherited by
+# forked workers when the parent parses it first
+_HEADERS = {}
+
+
+def _contents(page):
+    """References to a page's content streams, whether one or an array"""
+    contents = page.raw_get("/Contents")
+    if isinstance(contents.get_object(), ArrayObject):
+        return list(contents.get_object())
+    return [contents]
+
+
+class _BelowHeaderFrame(Frame):
+    """First-page frame that resumes where the header's flowables ended
+
+    Starting below the header, not at the frame top, keeps the first body
+    flowable's spaceBefore and its collapse with the header's last
+    spaceAfter, so the body lands exactly where a full render puts it.
+    """
+
+    def __init__(self, *args, offset=0, space_after=0, **kwargs):
+        self.offset = offset
+        self.space_after = space_after
+        super().__init__(*args, **kwargs)
+
+    def _reset(self):
+        super()._reset()
+        if self.offset:
+            self._y -= self.offset
+            self._atTop = 0
+            self._prevASpace = self.space_after
+
+
+class HeaderTemplate:
+    """The personal section rendered once, stamped onto body-only renders
+
+    Only the platypus layout at a fixed scale is supported: fitting to a
+    page count would rescale the header too. Templates hold only bytes and
+    numbers, so they pickle cheaply to worker processes.
+    """
+
+    def __init__(self, personal, scale=1.0, forms=False):
+        self.personal = personal
+        self.scale = scale
+        self.forms = forms
+
+        generator = ResumeGenerator.from_data({"personal": personal})
+        generator.set_scale(scale)
+        generator.use_forms = forms
+        story = generator.build_story()
+        if not story:
+            raise ValueError("overlay rendering needs a personal section to prerender")
+        self.pdf = self._render_header(story)
+        estimate = generator.estimate_layout()
+        self.offset = FRAME_SIZE[1] - estimate["remaining"]
+        self.space_after = estimate["trailing_space"]
+
+    @staticmethod
+    def _render_header(story):
+        """Render the header flowables as one form XObject shown on its page"""
+
+        def begin(canvas, doc):
+            canvas.beginForm(HEADER_FORM)
+
+        def end(canvas, doc):
+            canvas.endForm()
+            canvas.doForm(HEADER_FORM)
+
+        buffer = BytesIO()
+        doc = BaseDocTemplate(buffer, pagesize=letter, **PAGE_MARGINS)
+        frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height)
+        doc.addPageTemplates(
+            [PageTemplate("header", [frame], onPage=begin, onPageEnd=end)]
+        )
+        doc.build(story)
+        return buffer.getvalue()
+
+    def page(self):
+        """Return the parsed header page, whose content only shows the form"""
+        page = _HEADERS.get(self.pdf)
+        if page is None:
+            page = _HEADERS[self.pdf] = PdfReader(BytesIO(self.pdf)).pages[0]
+        return page
+
+    def render_body(self, data):
+        """Lay out everything but the personal section, leaving its space free"""
+        generator = ResumeGenerator.from_data(data)
+        generator.set_scale(self.scale)
+        generator.use_forms = self.forms
+        buffer = BytesIO()
+        doc = BaseDocTemplate(buffer, pagesize=letter, **PAGE_MARGINS)
+        frame = (doc.leftMargin, doc.bottomMargin, doc.width, doc.height)
+        doc.addPageTemplates(
+            [
+                PageTemplate(
+                    "first",
+                    [
+                        _BelowHeaderFrame(
+                            *frame, offset=self.offset, space_after=self.space_after
+                        )
+                    ],
+                    autoNextPageTemplate="later",
+                ),
+                PageTemplate("later", [Frame(*frame)]),
+            ]
+        )
+        doc.build(generator.build_story(exclude=("personal",)))
+        return buffer.getvalue()
+
+    def render(self, data):
+        """Render data, whose personal section must match, and return PDF bytes"""
+        if data.get("personal") != self.personal:
+            raise ValueError("personal section differs from the header template")
+
+        writer = PdfWriter()
+        for page in PdfReader(BytesIO(self.render_body(data))).pages:
+            writer.add_page(page)
+
+        # Draw the header first, as a full render does, so no text state set
+        # by the body (word spacing of justified lines) leaks into it. Cloning
+        # registers the form, its fonts and the stamping stream in the writer
+        header = self.page()
+        form = header["/Resources"]["/XObject"].raw_get(HEADER_XOBJECT)
+        stamps = [ref.get_object().clone(writer) for ref in _contents(header)]
+        page = writer.pages[0]
+        resources = page["/Resources"]
+        xobjects = resources.get("/XObject")
+        if xobjects is None:
+            xobjects = resources[NameObject("/XObject")] = DictionaryObject()
+        xobjects.get_object()[NameObject(HEADER_XOBJECT)] = (
+            form.get_object().clone(writer).indirect_reference
+        )
+        page[NameObject("/Contents")] = ArrayObject(
+            [stamp.indirect_reference for stamp in stamps] + _contents(page)
+        )
+
+        output = BytesIO()
+        writer.write(output)
+        return output.getvalue()
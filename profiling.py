@@ -0,0 +1,72 @@
+"""
+Render Pipeline Profiling
+Records wall and CPU time per phase of the render pipeline
+"""
+
+import json
+import time
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """Collect wall/CPU timings for named phases in the order they started
+
+    A phase run inside another is recorded as "outer/inner", and repeated
+    runs of the same qualified phase are summed into one row with a call
+    count, so e.g. the sections built for a layout estimate stay apart from
+    those built for the render itself.
+    """
+
+    def __init__(self):
+        self.phases = []
+        self._by_name = {}
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as phase name"""
+        self._stack.append(name)
+        qualified = "/".join(self._stack)
+        entry = self._by_name.get(qualified)
+        if entry is None:
+            entry = {"phase": qualified, "calls": 0, "wall_ms": 0.0, "cpu_ms": 0.0}
+            self._by_name[qualified] = entry
+            self.phases.append(entry)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            entry["calls"] += 1
+            entry["wall_ms"] += (time.perf_counter() - wall_start) * 1000
+            entry["cpu_ms"] += (time.process_time() - cpu_start) * 1000
+
+    def report(self, **metadata):
+        """Return the timings as a JSON-serialisable dict"""
+        phases = [
+            {
+                "phase": p["phase"],
+                "calls": p["calls"],
+                "wall_ms": round(p["wall_ms"], 3),
+                "cpu_ms": round(p["cpu_ms"], 3),
+            }
+            for p in self.phases
+        ]
+        return dict(metadata, phases=phases)
+
+    def write_report(self, path, **metadata):
+        """Write the timing report as JSON to path"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(**metadata), f, indent=2)
+
+    def format_table(self):
+        """Render the timings as an aligned text table"""
+        width = max([len(p["phase"]) for p in self.phases] + [5])
+        lines = [f"{'Phase':<{width}}  {'Calls':>5}  {'Wall ms':>9}  {'CPU ms':>9}"]
+        for p in self.phases:
+            lines.append(
+                f"{p['phase']:<{width}}  {p['calls']:>5}  "
+                f"{p['wall_ms']:>9.2f}  {p['cpu_ms']:>9.2f}"
+            )
+        return "\n".join(lines)
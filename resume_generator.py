@@ -0,0 +1,938 @@
+"""
+Resume Generator
+Lays out structured resume data as a professional PDF with reportlab
+"""
+
+import hashlib
+import json
+import os
+import threading
+import yaml
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from copy import copy
+from io import BytesIO
+from pathlib import Path
+
+try:
+    # LibYAML's C loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.colors import black, darkblue, grey
+from reportlab.platypus import (
+    SimpleDocTemplate,
+    Paragraph,
+    Spacer,
+    HRFlowable,
+    Flowable,
+)
+from reportlab.lib.enums import TA_CENTER
+from reportlab.pdfbase import pdfmetrics
+
+from font_metrics import install_paragraph_width_cache, string_width
+
+# Share memoized word widths between every paragraph wrapped in this process
+install_paragraph_width_cache()
+
+# Bump whenever a code change alters the rendered output, invalidating caches
+LAYOUT_VERSION = 3
+
+PAGE_MARGINS = {
+    "rightMargin": 0.4 * inch,
+    "leftMargin": 0.4 * inch,
+    "topMargin": 0.3 * inch,
+    "bottomMargin": 0.3 * inch,
+}
+
+# Usable width and height inside the page frame, which pads each side by 6pt
+FRAME_SIZE = (
+    letter[0] - PAGE_MARGINS["leftMargin"] - PAGE_MARGINS["rightMargin"] - 12,
+    letter[1] - PAGE_MARGINS["topMargin"] - PAGE_MARGINS["bottomMargin"] - 12,
+)
+
+# Overshoot platypus frames tolerate before a flowable no longer fits
+_LAYOUT_FUZZ = 1e-6
+
+
+class TwoColumnLine(Flowable):
+    """Custom flowable for left-right aligned text on the same line"""
+
+    def __init__(self, left_text, right_text, left_style, right_style, height=14):
+        self.left_text = left_text
+        self.right_text = right_text
+        self.left_style = left_style
+        self.right_style = right_style
+        self.height = height
+
+    def draw(self):
+        canvas = self.canv
+
+        # Draw left text at x=0
+        canvas.setFont(self.left_style["fontName"], self.left_style["fontSize"])
+        canvas.setFillColor(self.left_style.get("textColor", black))
+        canvas.drawString(0, 0, self.left_text)
+
+        # Calculate right text position using the actual available width
+        right_text_width = string_width(
+            self.right_text, self.right_style["fontName"], self.right_style["fontSize"]
+        )
+        right_x = self.width - right_text_width
+
+        # Draw right text
+        canvas.setFont(self.right_style["fontName"], self.right_style["fontSize"])
+        canvas.setFillColor(self.right_style.get("textColor", black))
+        canvas.drawString(right_x, 0, self.right_text)
+
+    def wrap(self, availWidth, availHeight):
+        # Use the actual available width provided by ReportLab
+        self.width = availWidth
+        return (availWidth, self.height)  # 14 points height for text by default
+
+
+class BlankSpace(Spacer):
+    """Spacer that writes nothing to the page
+
+    Spacer.drawOn still brackets its empty draw() in save, translate and
+    restore operators; the layout only needs the height.
+    """
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        pass
+
+
+class FormFlowable(Flowable):
+    """Draws a flowable through a PDF form XObject recorded once per document
+
+    Every FormFlowable with the same name must draw identically: the first
+    one drawn on a canvas records its flowable's operators as a form, and
+    the rest only reference it, so the content stream carries one short
+    "Do" per use instead of the full drawing operators.
+    """
+
+    def __init__(self, name, flowable):
+        self.name = name
+        self.flowable = flowable
+
+    def __copy__(self):
+        # Section cache hits copy flowables; the wrapped one holds state too
+        return FormFlowable(self.name, copy(self.flowable))
+
+    def wrap(self, availWidth, availHeight):
+        self.width, self.height = self.flowable.wrap(availWidth, availHeight)
+        return self.width, self.height
+
+    def getSpaceBefore(self):
+        return self.flowable.getSpaceBefore()
+
+    def getSpaceAfter(self):
+        return self.flowable.getSpaceAfter()
+
+    def draw(self):
+        canvas = self.canv
+        if not canvas.hasForm(self.name):
+            # The bounding box clips, so leave room for strokes and line caps
+            canvas.beginForm(self.name, -2, -2, self.width + 2, max(self.height, 0) + 2)
+            self.flowable.drawOn(canvas, 0, 0)
+            canvas.endForm()
+        canvas.doForm(self.name)
+
+
+def _scaled_style(name, parent, scale, **kwargs):
+    """Create a ParagraphStyle whose sizes and spacing are multiplied by scale"""
+    for key in ("fontSize", "spaceBefore", "spaceAfter"):
+        if key in kwargs:
+            kwargs[key] *= scale
+    kwargs.setdefault("leading", parent.leading * scale)
+    return ParagraphStyle(name=name, parent=parent, **kwargs)
+
+
+def _build_stylesheet(scale=1.0):
+    """Build the resume stylesheet with every size multiplied by scale"""
+    styles = getSampleStyleSheet()
+
+    # Name style
+    styles.add(
+        _scaled_style(
+            "Name",
+            styles["Heading1"],
+            scale,
+            fontSize=20,
+            textColor=darkblue,
+            spaceAfter=6,
+            alignment=TA_CENTER,
+            fontName="Helvetica-Bold",
+        )
+    )
+
+    # Contact info style
+    styles.add(
+        _scaled_style(
+            "Contact",
+            styles["Normal"],
+            scale,
+            fontSize=11,
+            textColor=black,
+            spaceAfter=6,
+            alignment=TA_CENTER,
+            fontName="Helvetica",
+        )
+    )
+
+    # Section header style
+    styles.add(
+        _scaled_style(
+            "SectionHeader",
+            styles["Heading2"],
+            scale,
+            fontSize=14,
+            textColor=black,
+            spaceBefore=8,
+            spaceAfter=1,
+            fontName="Helvetica-Bold",
+        )
+    )
+
+    # Job title style
+    styles.add(
+        _scaled_style(
+            "JobTitle",
+            styles["Normal"],
+            scale,
+            fontSize=11,
+            textColor=black,
+            fontName="Helvetica-Bold",
+            spaceAfter=2,
+        )
+    )
+
+    # Company style
+    styles.add(
+        _scaled_style(
+            "Company",
+            styles["Normal"],
+            scale,
+            fontSize=11,
+            textColor=black,
+            fontName="Helvetica-Bold",
+            spaceAfter=2,
+        )
+    )
+
+    # Date/Location style
+    styles.add(
+        _scaled_style(
+            "DateLocation",
+            styles["Normal"],
+            scale,
+            fontSize=11,
+            textColor=grey,
+            fontName="Helvetica-Oblique",
+            spaceAfter=4,
+        )
+    )
+
+    # Description style (for regular text like skills)
+    styles.add(
+        _scaled_style(
+            "Description",
+            styles["Normal"],
+            scale,
+            fontSize=11,
+            textColor=black,
+            fontName="Helvetica",
+            leftIndent=0,
+            spaceAfter=2,
+        )
+    )
+
+    # Bullet point style with hanging indent
+    dash_space_width = string_width("- ", "Helvetica", 11 * scale)
+
+    styles.add(
+        _scaled_style(
+            "BulletPoint",
+            styles["Normal"],
+            scale,
+            fontSize=11,
+            textColor=black,
+            fontName="Helvetica",
+            leftIndent=dash_space_width,  # Exact width of "- " in this font/size
+            firstLineIndent=-dash_space_width,  # Pull first line back to margin
+            spaceAfter=2,
+        )
+    )
+
+    return styles
+
+
+def item_text(item):
+    """Text of a bullet or skill, which may be tagged as {text: ..., tags: [...]}"""
+    return item["text"] if isinstance(item, dict) else item
+
+
+def iter_documents(input_file):
+    """Lazily yield each resume document of a multi-document YAML stream"""
+    with open(input_file, "r", encoding="utf-8") as f:
+        for document in yaml.load_all(f, Loader=SafeLoader):
+            # Skip empty documents, e.g. from a leading or trailing "---"
+            if document:
+                yield document
+
+
+def stack_height(measured):
+    """Height of (height, space before, space after) entries stacked in one frame"""
+    height = 0
+    prev_space_after = None
+    for flowable_height, space_before, space_after in measured:
+        # Frames collapse adjacent spacing and drop it at the top of a frame
+        if prev_space_after is not None:
+            height += max(space_before, prev_space_after)
+        height += flowable_height
+        prev_space_after = space_after
+    return height + (prev_space_after or 0)
+
+
+# Process-wide registry of built stylesheets, keyed by scale. Building one
+# takes longer than copying its styles, so each is built once and generators
+# get their own copies.
+_STYLE_REGISTRY = {}
+
+
+def _copy_style(style):
+    """Shallow copy of a style; PropertySet attributes live in its __dict__"""
+    copy = object.__new__(type(style))
+    copy.__dict__.update(style.__dict__)
+    return copy
+
+
+def get_stylesheet(scale=1.0):
+    """Return a private copy of the stylesheet for the given scale
+
+    Callers may change the returned styles without affecting any other
+    generator. Cached sections are keyed by scale, not by style, so a
+    generator rendering with changed styles should set section_cache to None.
+    """
+    styles = _STYLE_REGISTRY.get(scale)
+    if styles is None:
+        styles = _STYLE_REGISTRY.setdefault(
+            scale, dict(_build_stylesheet(scale).byName)
+        )
+    return {name: _copy_style(style) for name, style in styles.items()}
+
+
+class SectionCache:
+    """Thread-safe LRU cache of the flowables built for each resume section
+
+    Entries are keyed on the section's data and the layout scale, so an edit
+    to one bullet only rebuilds its own section. Hits return shallow copies:
+    flowables hold per-build state (the canvas while drawing, wrapped width),
+    so concurrent builds must not share instances, but the parsed paragraph
+    markup they point at is reused as-is.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, name, generator, create_section):
+        """Return the section's flowables, building them only on a miss"""
+        from cache import cache_key
+
+        key = cache_key(
+            {name: generator.data.get(name)},
+            {"section": name, "scale": generator.scale, "forms": generator.use_forms},
+            LAYOUT_VERSION,
+        )
+        with self._lock:
+            flowables = self._entries.get(key)
+            if flowables is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [copy(flowable) for flowable in flowables]
+            self.misses += 1
+
+        flowables = []
+        create_section(flowables)
+        with self._lock:
+            self._entries[key] = flowables
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return [copy(flowable) for flowable in flowables]
+
+    def stats(self):
+        """Return reuse counters for the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+# Process-wide section cache shared by every generator
+SECTION_CACHE = SectionCache()
+
+
+class ResumeGenerator:
+    """Generate professional resume PDF from structured input data"""
+
+    def __init__(
+        self,
+        input_file="resume_data.yaml",
+        output_file="Narayan, Sarthak - Resume.pdf",
+        snapshot_dir=None,
+    ):
+        self.input_file = input_file
+        self.output_file = output_file
+        self.snapshot_dir = snapshot_dir
+        self.timer = None  # profiling.PhaseTimer when profiling is enabled
+        self.section_cache = SECTION_CACHE  # None rebuilds every section
+        self.data = {}
+        self.engine = "platypus"  # or "canvas" for the direct canvas engine
+        self.scale = 1.0
+        self.styles = get_stylesheet(self.scale)
+        # Draw repeated elements (section rules) through PDF form XObjects
+        self.use_forms = False
+
+    @classmethod
+    def from_data(cls, data, output_file=None):
+        """Create a generator for already parsed resume data"""
+        generator = cls(input_file=None, output_file=output_file)
+        generator.data = data
+        return generator
+
+    def _phase(self, name):
+        """Time a pipeline phase when profiling is enabled"""
+        if self.timer is None:
+            return nullcontext()
+        return self.timer.phase(name)
+
+    def parse_input_file(self):
+        """Parse the YAML file and extract structured data"""
+        with self._phase("parse"):
+            self._parse_input_file()
+
+    def _parse_input_file(self):
+        if not Path(self.input_file).exists():
+            raise FileNotFoundError(f"Input file {self.input_file} not found!")
+
+        if self.snapshot_dir is None:
+            self.data = self._load_yaml()
+            return
+
+        # Reuse the compiled JSON snapshot while the source file is unchanged
+        stat = os.stat(self.input_file)
+        source = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        snapshot_path = self._snapshot_path()
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot["source"] == source:
+                self.data = snapshot["data"]
+                return
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self.data = self._load_yaml()
+        try:
+            payload = json.dumps({"source": source, "data": self.data})
+        except TypeError:
+            # Data holds YAML-only types (e.g. dates); keep parsing the YAML
+            return
+        Path(self.snapshot_dir).mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, snapshot_path)
+
+    def _load_yaml(self):
+        """Load the input file with the fastest available safe YAML loader"""
+        with open(self.input_file, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=SafeLoader)
+
+    def _snapshot_path(self):
+        """Path of the compiled JSON snapshot for the input file"""
+        source = str(Path(self.input_file).resolve())
+        name = hashlib.sha256(source.encode("utf-8")).hexdigest()[:32]
+        return Path(self.snapshot_dir) / f"{name}.json"
+
+    def _spacer(self, height):
+        """Vertical spacer of height inches, scaled along with the styles"""
+        return BlankSpace(1, height * inch * self.scale)
+
+    def set_scale(self, scale):
+        """Scale every font size and spacing amount of the layout"""
+        self.scale = scale
+        self.styles = get_stylesheet(scale)
+
+    def wrap_story(self, story):
+        """Return (height, space before, space after) per flowable, via wrap() only"""
+        width, height = FRAME_SIZE
+        measured = []
+        for flowable in story:
+            _, flowable_height = flowable.wrap(width, height)
+            measured.append(
+                (flowable_height, flowable.getSpaceBefore(), flowable.getSpaceAfter())
+            )
+        return measured
+
+    def measure_story(self, story):
+        """Return the height the story occupies in one frame, using wrap() only"""
+        return stack_height(self.wrap_story(story))
+
+    def estimate_layout(self, story=None, pages=None):
+        """Predict pagination using wrap() and split() only, drawing nothing
+
+        Follows the frame's placement rules: spacing collapses between
+        flowables and is dropped at the top of a page, and a flowable that
+        does not fit is split (paragraphs) or moved to the next page. Returns
+        the predicted page count, the vertical space left on the last page,
+        the spacing still owed after the last flowable and, if pages is
+        given, the index and flowable of the first story entry that does not
+        fit within that many pages.
+        """
+        with self._phase("estimate"):
+            return self._estimate_layout(story, pages)
+
+    def _estimate_layout(self, story, pages):
+        if story is None:
+            story = self.build_story()
+        width, height = FRAME_SIZE
+        queue = deque(enumerate(story))
+        page = 1
+        y = height
+        at_top = True
+        prev_space_after = 0
+        overflow = None
+
+        while queue:
+            index, flowable = queue.popleft()
+            space = 0
+            if not at_top:
+                space = max(flowable.getSpaceBefore() - prev_space_after, 0)
+            available = y - space
+            placed = None
+            if available > 0:
+                _, flowable_height = flowable.wrap(width, available)
+                if flowable_height <= available + _LAYOUT_FUZZ:
+                    placed = flowable_height
+                else:
+                    parts = flowable.split(width, available)
+                    if parts:
+                        flowable = parts[0]
+                        _, placed = flowable.wrap(width, available)
+                        queue.extendleft((index, part) for part in reversed(parts[1:]))
+            if placed is None and at_top:
+                # Taller than an empty page; platypus would raise LayoutError
+                placed = available
+            if placed is None:
+                queue.appendleft((index, flowable))
+                page += 1
+                y = height
+                at_top = True
+                prev_space_after = 0
+                continue
+
+            if pages is not None and page > pages and overflow is None:
+                overflow = (index, story[index])
+            space_after = flowable.getSpaceAfter()
+            moved = space + placed + space_after
+            y -= moved
+            prev_space_after = space_after
+            at_top = at_top and not moved
+
+        return {
+            "pages": page,
+            "remaining": max(y, 0),
+            "trailing_space": prev_space_after,
+            "overflow_index": overflow[0] if overflow else None,
+            "overflow": overflow[1] if overflow else None,
+        }
+
+    def fit_to_pages(self, pages=1, min_scale=0.7, precision=0.005):
+        """Find the largest scale at which the resume fits within pages
+
+        Bisects over the style/spacing scale using wrap-only measurement passes,
+        so only a handful of layouts are computed and nothing is drawn.
+        Returns the chosen scale, which is also applied to the generator.
+        Raises ValueError if the resume overflows even at min_scale.
+        """
+
+        def fits(scale):
+            self.set_scale(scale)
+            return self.estimate_layout(pages=pages)["overflow"] is None
+
+        if fits(1.0):
+            return 1.0
+        if not fits(min_scale):
+            raise ValueError(
+                f"does not fit {pages} page(s) even at scale {min_scale:.2f}"
+            )
+
+        low, high = min_scale, 1.0
+        while high - low > precision:
+            # Snap to the precision grid so the style registry stays bounded
+            mid = round((low + high) / 2 / precision) * precision
+            if mid <= low or mid >= high:
+                break
+            if fits(mid):
+                low = mid
+            else:
+                high = mid
+        self.set_scale(low)
+        return low
+
+    def add_section_separator(self, story):
+        """Add a horizontal line separator after section heading"""
+        # story.append(Spacer(1, 0.02 * inch))
+        rule = HRFlowable(width="100%", thickness=0.5, color=black)
+        if self.use_forms:
+            rule = FormFlowable("SectionRule", rule)
+        story.append(rule)
+        story.append(self._spacer(0.08))
+
+    def create_personal_section(self, story):
+        """Create the personal information section"""
+        if "personal" not in self.data:
+            return
+
+        personal = self.data["personal"]
+
+        # Name
+        if "name" in personal:
+            name = Paragraph(personal["name"], self.styles["Name"])
+            story.append(name)
+
+        # Contact information
+        contact_info = []
+        if "email" in personal:
+            contact_info.append(personal["email"])
+        if "phone" in personal:
+            contact_info.append(personal["phone"])
+        if "location" in personal:
+            contact_info.append(personal["location"])
+        if "linkedin" in personal:
+            contact_info.append(personal["linkedin"])
+        if "github" in personal:
+            contact_info.append(personal["github"])
+        if "website" in personal:
+            contact_info.append(personal["website"])
+
+        if contact_info:
+            contact_text = " • ".join(contact_info)
+            contact = Paragraph(contact_text, self.styles["Contact"])
+            story.append(contact)
+
+        story.append(self._spacer(0.03))
+
+    def create_experience_section(self, story):
+        """Create the experience section"""
+        if "experience" not in self.data or not self.data["experience"]:
+            return
+
+        story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles["SectionHeader"]))
+        self.add_section_separator(story)
+
+        for exp in self.data["experience"]:
+            # Company (left) - Location (right) line
+            if "company" in exp and "location" in exp:
+                company_location_line = TwoColumnLine(
+                    left_text=exp["company"],
+                    right_text=exp["location"],
+                    left_style={
+                        "fontName": "Helvetica-Bold",
+                        "fontSize": 12 * self.scale,
+                        "textColor": black,
+                    },
+                    right_style={
+                        "fontName": "Helvetica",
+                        "fontSize": 11 * self.scale,
+                        "textColor": black,
+                    },
+                    height=14 * self.scale,
+                )
+                story.append(company_location_line)
+                story.append(self._spacer(0.02))
+
+            # Title (left) - Date (right) line
+            if "title" in exp and "duration" in exp:
+                title_date_line = TwoColumnLine(
+                    left_text=exp["title"],
+                    right_text=exp["duration"],
+                    left_style={
+                        "fontName": "Helvetica-Oblique",
+                        "fontSize": 11 * self.scale,
+                        "textColor": black,
+                    },
+                    right_style={
+                        "fontName": "Helvetica-Oblique",
+                        "fontSize": 11 * self.scale,
+                        "textColor": grey,
+                    },
+                    height=14 * self.scale,
+                )
+                story.append(title_date_line)
+                story.append(self._spacer(0.04))
+
+            # Responsibilities
+            if "responsibilities" in exp:
+                for responsibility in map(item_text, exp["responsibilities"]):
+                    description = Paragraph(
+                        f"- {responsibility}", self.styles["BulletPoint"]
+                    )
+                    story.append(description)
+
+            story.append(self._spacer(0.05))
+
+    def create_education_section(self, story):
+        """Create the education section"""
+        if "education" not in self.data or not self.data["education"]:
+            return
+
+        story.append(Paragraph("EDUCATION", self.styles["SectionHeader"]))
+        self.add_section_separator(story)
+
+        for edu in self.data["education"]:
+            # Institution (left) - Location (right) line
+            if "institution" in edu and "location" in edu:
+                institution_duration_line = TwoColumnLine(
+                    left_text=edu["institution"],
+                    right_text=edu["location"],
+                    left_style={
+                        "fontName": "Helvetica-Bold",
+                        "fontSize": 12 * self.scale,
+                        "textColor": black,
+                    },
+                    right_style={
+                        "fontName": "Helvetica",
+                        "fontSize": 11 * self.scale,
+                        "textColor": black,
+                    },
+                    height=14 * self.scale,
+                )
+                story.append(institution_duration_line)
+                story.append(self._spacer(0.02))
+
+            # Degree (left) - Duration (right) line
+            if "degree" in edu and "duration" in edu:
+                degree_location_line = TwoColumnLine(
+                    left_text=edu["degree"],
+                    right_text=edu["duration"],
+                    left_style={
+                        "fontName": "Helvetica-Oblique",
+                        "fontSize": 11 * self.scale,
+                        "textColor": black,
+                    },
+                    right_style={
+                        "fontName": "Helvetica-Oblique",
+                        "fontSize": 11 * self.scale,
+                        "textColor": grey,
+                    },
+                    height=14 * self.scale,
+                )
+                story.append(degree_location_line)
+                story.append(self._spacer(0.05))
+
+    def create_skills_section(self, story):
+        """Create the skills section"""
+        if "skills" not in self.data or not self.data["skills"]:
+            return
+
+        story.append(Paragraph("TECHNICAL SKILLS", self.styles["SectionHeader"]))
+        self.add_section_separator(story)
+
+        # Handle simple list of skills
+        skills_text = ", ".join(map(item_text, self.data["skills"]))
+        skills_para = Paragraph(skills_text, self.styles["Description"])
+        story.append(skills_para)
+
+        story.append(self._spacer(0.1))
+
+    def create_certifications_section(self, story):
+        """Create the certifications section"""
+        if "certifications" not in self.data or not self.data["certifications"]:
+            return
+
+        story.append(Paragraph("CERTIFICATIONS", self.styles["SectionHeader"]))
+        self.add_section_separator(story)
+
+        for cert in self.data["certifications"]:
+            cert_para = Paragraph(f"• {cert}", self.styles["Description"])
+            story.append(cert_para)
+
+    def create_projects_section(self, story):
+        """Create the projects section"""
+        if "projects" not in self.data or not self.data["projects"]:
+            return
+
+        story.append(Paragraph("PROJECTS", self.styles["SectionHeader"]))
+
+        for project in self.data["projects"]:
+            # Project name
+            if "name" in project:
+                name = Paragraph(f"<b>{project['name']}</b>", self.styles["JobTitle"])
+                story.append(name)
+
+            # Description
+            if "description" in project:
+                desc = Paragraph(project["description"], self.styles["Description"])
+                story.append(desc)
+
+            # Technologies
+            if "technologies" in project:
+                tech = Paragraph(
+                    f"<b>Technologies:</b> {project['technologies']}",
+                    self.styles["Description"],
+                )
+                story.append(tech)
+
+            # Link
+            if "link" in project:
+                link = Paragraph(
+                    f"<b>Link:</b> {project['link']}", self.styles["Description"]
+                )
+                story.append(link)
+
+            story.append(self._spacer(0.1))
+
+    def build_story(self, exclude=()):
+        """Build the list of flowables making up the resume, minus exclude"""
+        story = []
+
+        # Build the resume sections
+        sections = (
+            ("personal", self.create_personal_section),
+            ("experience", self.create_experience_section),
+            ("education", self.create_education_section),
+            ("skills", self.create_skills_section),
+            ("certifications", self.create_certifications_section),
+            ("projects", self.create_projects_section),
+        )
+        for name, create_section in sections:
+            if name in exclude:
+                continue
+            with self._phase(f"section:{name}"):
+                if self.section_cache is None:
+                    create_section(story)
+                else:
+                    story.extend(
+                        self.section_cache.get_or_build(name, self, create_section)
+                    )
+
+        return story
+
+    def render_to(self, stream):
+        """Render the resume PDF into a file path or writable file object"""
+        if self.engine == "canvas":
+            from canvas_engine import CanvasRenderer
+
+            with self._phase("layout"):
+                CanvasRenderer(self).render_to(stream)
+            return
+
+        doc = SimpleDocTemplate(stream, pagesize=letter, **PAGE_MARGINS)
+        with self._phase("build_story"):
+            story = self.build_story()
+        with self._phase("layout"):
+            doc.build(story)
+
+    def render_bytes(self):
+        """Render the resume PDF in memory and return its bytes"""
+        buffer = BytesIO()
+        self.render_to(buffer)
+        return buffer.getvalue()
+
+    def layout_config(self):
+        """Return the layout parameters that affect the rendered output"""
+        return {
+            "engine": self.engine,
+            "scale": self.scale,
+            "forms": self.use_forms,
+            "pagesize": letter,
+            "margins": PAGE_MARGINS,
+        }
+
+    def check_pages(self, max_pages):
+        """Raise ValueError if the layout estimate runs past max_pages"""
+        estimate = self.estimate_layout(pages=max_pages)
+        if estimate["overflow"] is not None:
+            raise ValueError(
+                f"predicted {estimate['pages']} pages, more than {max_pages}"
+            )
+
+    def validate(self):
+        """Raise ResumeValidationError listing every schema problem in the data"""
+        from schema import ResumeValidationError, validate_resume
+
+        with self._phase("validate"):
+            errors = validate_resume(self.data)
+        if errors:
+            raise ResumeValidationError(errors)
+
+    def generate_pdf(self, verbose=True, cache=None, fit_pages=None, max_pages=None):
+        """Generate the complete resume PDF, reusing a cached render if possible
+
+        The data must already have passed validate(), which callers run once
+        where it enters. fit_pages scales the layout down until it fits. With
+        max_pages, a resume predicted to run longer is rejected with
+        ValueError before anything is rendered.
+        """
+        if max_pages is not None and not fit_pages:
+            self.check_pages(max_pages)
+
+        if cache is not None:
+            from cache import cache_key
+
+            config = self.layout_config()
+            if fit_pages:
+                # Keyed on the request rather than the fitted scale, which
+                # fit_to_pages always searches afresh, so a hit skips the
+                # bisection's layout passes entirely
+                config.update(scale=None, fit_pages=fit_pages, max_pages=max_pages)
+            key = cache_key(self.data, config, LAYOUT_VERSION)
+            # A missing entry, even one evicted since the lookup, is a miss
+            if cache.copy_to(key, self.output_file):
+                if verbose:
+                    print(f"Resume generated successfully: {self.output_file}")
+                return
+
+        if fit_pages:
+            with self._phase("fit"):
+                self.fit_to_pages(fit_pages)
+            if max_pages is not None:
+                self.check_pages(max_pages)
+
+        if cache is None:
+            self.render_to(self.output_file)
+        else:
+            pdf = self.render_bytes()
+            cache.put(key, pdf)
+            with open(self.output_file, "wb") as f:
+                f.write(pdf)
+
+        if verbose:
+            print(f"Resume generated successfully: {self.output_file}")
+
+
+def prewarm():
+    """Load the stylesheet, font metrics and render machinery ahead of use
+
+    Long-running processes call this before their first render, and pools
+    call it before forking so every worker inherits the loaded state.
+    """
+    styles = get_stylesheet()
+    # List styles carry no font of their own
+    fonts = {s.fontName for s in styles.values() if hasattr(s, "fontName")}
+    for font_name in fonts:
+        pdfmetrics.getFont(font_name)
+    ResumeGenerator.from_data({"personal": {"name": "Warm Up"}}).render_bytes()
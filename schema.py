@@ -0,0 +1,252 @@
+"""
+Resume Data Schema
+Declares the structure of resume_data.yaml and compiles it once into nested
+checker functions that report every problem in a document in a single pass
+"""
+
+# Bullets and skills are plain strings or tagged as {text: ..., tags: [...]}
+_ITEM = {
+    "anyOf": [
+        {"type": "string"},
+        {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["text"],
+        },
+    ]
+}
+
+# Sections may be left empty (None). Two-column lines are only drawn when both
+# halves are present, so each half requires the other rather than vanishing
+RESUME_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "personal": {
+            "type": "object",
+            "properties": {
+                key: {"type": "string"}
+                for key in (
+                    "name",
+                    "email",
+                    "phone",
+                    "location",
+                    "linkedin",
+                    "github",
+                    "website",
+                )
+            },
+        },
+        "experience": {
+            "type": "array",
+            "nullable": True,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "company": {"type": "string"},
+                    "location": {"type": "string"},
+                    "title": {"type": "string"},
+                    "duration": {"type": "string"},
+                    "responsibilities": {"type": "array", "items": _ITEM},
+                },
+                "dependentRequired": {
+                    "company": ["location"],
+                    "location": ["company"],
+                    "title": ["duration"],
+                    "duration": ["title"],
+                },
+            },
+        },
+        "education": {
+            "type": "array",
+            "nullable": True,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "institution": {"type": "string"},
+                    "location": {"type": "string"},
+                    "degree": {"type": "string"},
+                    "duration": {"type": "string"},
+                },
+                "dependentRequired": {
+                    "institution": ["location"],
+                    "location": ["institution"],
+                    "degree": ["duration"],
+                    "duration": ["degree"],
+                },
+            },
+        },
+        "skills": {"type": "array", "nullable": True, "items": _ITEM},
+        "certifications": {
+            "type": "array",
+            "nullable": True,
+            "items": {"type": "string"},
+        },
+        "projects": {
+            "type": "array",
+            "nullable": True,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                    "technologies": {"type": "string"},
+                    "link": {"type": "string"},
+                },
+            },
+        },
+        "variants": {
+            "type": "array",
+            "nullable": True,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                    "output": {"type": "string"},
+                },
+            },
+        },
+    },
+}
+
+_TYPES = {
+    "string": str,
+    "object": dict,
+    "array": list,
+}
+
+
+class ResumeValidationError(ValueError):
+    """Resume data that does not match the schema; errors lists every problem"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} problem(s) in resume data:\n"
+            + "\n".join(f"  {error}" for error in errors)
+        )
+
+    def __reduce__(self):
+        # Rebuild from the error list, not the message, across process pools
+        return type(self), (self.errors,)
+
+
+def _join(path, key):
+    return f"{path}.{key}" if path else key
+
+
+def compile_schema(schema):
+    """Compile a schema into check(value, path, errors), which appends problems
+
+    Supports the subset of JSON Schema the resume format needs: type (with
+    OpenAPI's nullable), properties (unknown keys are errors), required,
+    dependentRequired, items and anyOf. All dispatch is resolved here, once.
+    """
+    checks = []
+
+    if "type" in schema:
+        expected = _TYPES[schema["type"]]
+        type_name = schema["type"]
+        nullable = schema.get("nullable", False)
+
+        def check_type(value, path, errors):
+            if value is None and nullable:
+                return False
+            if not isinstance(value, expected):
+                errors.append(
+                    f"{path or 'document'}: expected {type_name}, "
+                    f"got {type(value).__name__}"
+                )
+                return False
+            return True
+
+        checks.append(check_type)
+
+    if "properties" in schema:
+        properties = {
+            key: compile_schema(subschema)
+            for key, subschema in schema["properties"].items()
+        }
+        required = tuple(schema.get("required", ()))
+        dependent = tuple(schema.get("dependentRequired", {}).items())
+
+        def check_properties(value, path, errors):
+            for key in required:
+                if key not in value:
+                    errors.append(f"{path or 'document'}: missing '{key}'")
+            for key, needs in dependent:
+                if key in value:
+                    for other in needs:
+                        if other not in value:
+                            errors.append(
+                                f"{path or 'document'}: '{key}' requires '{other}'"
+                            )
+            for key, item in value.items():
+                check = properties.get(key)
+                if check is None:
+                    errors.append(f"{path or 'document'}: unknown key '{key}'")
+                else:
+                    check(item, _join(path, key), errors)
+            return True
+
+        checks.append(check_properties)
+
+    if "items" in schema:
+        check_item = compile_schema(schema["items"])
+
+        def check_items(value, path, errors):
+            for index, item in enumerate(value):
+                check_item(item, f"{path}[{index}]", errors)
+            return True
+
+        checks.append(check_items)
+
+    if "anyOf" in schema:
+        options = [
+            (_TYPES.get(option.get("type"), object), compile_schema(option))
+            for option in schema["anyOf"]
+        ]
+        type_names = " or ".join(option["type"] for option in schema["anyOf"])
+
+        def check_any_of(value, path, errors):
+            attempts = []
+            for expected, option in options:
+                if not isinstance(value, expected):
+                    continue
+                option_errors = []
+                option(value, path, option_errors)
+                if not option_errors:
+                    return True
+                attempts.append(option_errors)
+            if not attempts:
+                errors.append(
+                    f"{path or 'document'}: expected {type_names}, "
+                    f"got {type(value).__name__}"
+                )
+            else:
+                # Report the alternative of the right type that came closest
+                errors.extend(min(attempts, key=len))
+            return False
+
+        checks.append(check_any_of)
+
+    def check(value, path, errors):
+        for step in checks:
+            # Stop after a wrong type, or None, which has no structure to check
+            if not step(value, path, errors):
+                return
+
+    return check
+
+
+_check_resume = compile_schema(RESUME_SCHEMA)
+
+
+def validate_resume(data):
+    """Return every schema problem in parsed resume data; empty if valid"""
+    errors = []
+    _check_resume(data, "", errors)
+    return errors
@@ -0,0 +1,159 @@
+"""
+Resume Render Server
+Local HTTP server that keeps ReportLab warm and renders YAML/JSON payloads to PDF
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yaml
+
+from font_metrics import width_cache_stats
+from resume_generator import SECTION_CACHE, ResumeGenerator, prewarm
+from schema import ResumeValidationError, validate_resume
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Thread-safe cumulative histogram of request latencies"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, elapsed_ms):
+        """Record a single latency sample"""
+        with self._lock:
+            self.counts[bisect_left(self.buckets, elapsed_ms)] += 1
+            self.count += 1
+            self.total_ms += elapsed_ms
+
+    def snapshot(self):
+        """Return the histogram as a JSON-serialisable dict"""
+        with self._lock:
+            labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+            return {
+                "count": self.count,
+                "sum_ms": round(self.total_ms, 3),
+                "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0,
+                "buckets": dict(zip(labels, self.counts)),
+            }
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """Handle POST /render and GET /metrics"""
+
+    server_version = "ResumeRenderServer/1.0"
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            metrics = {
+                "latency": self.server.histogram.snapshot(),
+                "rejected": self.server.rejected,
+                "max_concurrency": self.server.max_concurrency,
+                "width_cache": width_cache_stats(),
+                "section_cache": SECTION_CACHE.stats(),
+            }
+            self._send(200, "application/json", json.dumps(metrics).encode())
+        elif self.path == "/healthz":
+            self._send(200, "text/plain", b"ok")
+        else:
+            self._send(404, "text/plain", b"not found")
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send(404, "text/plain", b"not found")
+            return
+
+        # Reject rather than queue unboundedly when every render slot is busy
+        if not self.server.slots.acquire(timeout=self.server.queue_timeout):
+            self.server.rejected += 1
+            self._send(503, "text/plain", b"server busy")
+            return
+
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            try:
+                data = self._parse_payload(body)
+            except (ValueError, yaml.YAMLError) as e:
+                self._send(400, "text/plain", f"Invalid payload: {e}".encode())
+                return
+
+            try:
+                pdf = ResumeGenerator.from_data(data).render_bytes()
+            except Exception as e:
+                self._send(500, "text/plain", f"Error generating resume: {e}".encode())
+                return
+
+            self._send(200, "application/pdf", pdf)
+        finally:
+            self.server.slots.release()
+            self.server.histogram.observe((time.perf_counter() - start) * 1000)
+
+    def _parse_payload(self, body):
+        """Decode a JSON or YAML resume payload into a dict"""
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            data = json.loads(body)
+        else:
+            data = yaml.safe_load(body)
+        if not isinstance(data, dict):
+            raise ValueError("resume payload must be a mapping")
+        errors = validate_resume(data)
+        if errors:
+            raise ResumeValidationError(errors)
+        return data
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class RenderServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a bounded number of concurrent renders"""
+
+    daemon_threads = True
+
+    def __init__(self, address, max_concurrency=4, queue_timeout=5.0, verbose=False):
+        super().__init__(address, RenderRequestHandler)
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.verbose = verbose
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.histogram = LatencyHistogram()
+        self.rejected = 0
+
+
+def warm_up():
+    """Load styles and font metrics so the first request pays no setup cost"""
+    prewarm()
+
+
+def serve(host="127.0.0.1", port=8000, max_concurrency=4, verbose=False):
+    """Run the render server until interrupted"""
+    warm_up()
+    server = RenderServer((host, port), max_concurrency, verbose=verbose)
+    print(f"Serving resume renders on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
@@ -0,0 +1,301 @@
+"""
+Resume Tailoring
+Ranks experience bullets and skills against job descriptions using an inverted
+index with TF-IDF weighting, built once per resume and queried per posting
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+    a about above across after all also an and any are as at be been being but
+    by can could did do does during each etc for from had has have having how
+    if in into is it its may more most must not of on or our over per should
+    so such than that the their them then there these they this those through
+    to under up use used using via was we were what when where which while who
+    will with within would you your
+    """.split())
+
+
+# Value of a bullet that matches no keyword, so spare room is still used
+UNMATCHED_BULLET_VALUE = 1e-3
+
+
+def tokenize(text):
+    """Lowercase keyword tokens of text, without stopwords"""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class BulletIndex:
+    """Inverted index over one resume's experience bullets and skills"""
+
+    def __init__(self, data):
+        from resume_generator import item_text
+
+        self.data = data
+        # Document ids index self.documents; the id lists map them back to
+        # (experience, bullet) and skill positions in the data
+        self.documents = []
+        self.bullet_ids = []
+        self.skill_ids = []
+        for i, exp in enumerate(data.get("experience") or ()):
+            for j, bullet in enumerate(exp.get("responsibilities") or ()):
+                self.bullet_ids.append((len(self.documents), i, j))
+                self.documents.append(item_text(bullet))
+        for i, skill in enumerate(data.get("skills") or ()):
+            self.skill_ids.append((len(self.documents), i))
+            self.documents.append(item_text(skill))
+
+        # term -> {document id: term frequency}
+        self.postings = defaultdict(dict)
+        for doc_id, text in enumerate(self.documents):
+            for term, count in Counter(tokenize(text)).items():
+                self.postings[term][doc_id] = count
+
+        total = len(self.documents)
+        self.idf = {
+            term: math.log((total + 1) / (len(docs) + 1)) + 1
+            for term, docs in self.postings.items()
+        }
+        norms = [0.0] * total
+        for term, docs in self.postings.items():
+            for doc_id, count in docs.items():
+                norms[doc_id] += (count * self.idf[term]) ** 2
+        self.norms = [math.sqrt(n) or 1.0 for n in norms]
+        self._layout = None
+
+    def score(self, job_description):
+        """Return {document id: TF-IDF cosine score} for matching documents"""
+        scores = defaultdict(float)
+        for term, query_count in Counter(tokenize(job_description)).items():
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            weight = query_count * self.idf[term] ** 2
+            for doc_id, count in docs.items():
+                scores[doc_id] += weight * count
+        return {doc_id: s / self.norms[doc_id] for doc_id, s in scores.items()}
+
+    def ranked_bullets(self, job_description):
+        """Return [(score, experience index, bullet index)], best first
+
+        Every bullet is listed, unmatched ones with a score of zero in their
+        original order, so callers can fill any remaining budget.
+        """
+        return self._rank_bullets(self.score(job_description))
+
+    def _rank_bullets(self, scores):
+        ranked = [(scores.get(doc_id, 0.0), i, j) for doc_id, i, j in self.bullet_ids]
+        return sorted(ranked, key=lambda r: (-r[0], r[1], r[2]))
+
+    def tailor(
+        self, job_description, max_bullets=None, max_chars=None, max_skills=None
+    ):
+        """Return a copy of the resume data trimmed to the best-matching content
+
+        Bullets are chosen by score until max_bullets or max_chars of bullet
+        text is reached. Each experience's best bullet is taken first, budget
+        permitting, and chosen bullets are listed best first. Matching skills
+        move to the front.
+        """
+        scores = self.score(job_description)
+        text = {(i, j): self.documents[doc_id] for doc_id, i, j in self.bullet_ids}
+        chosen = defaultdict(dict)  # experience index -> {bullet index: score}
+        used_chars = 0
+        count = 0
+
+        # First pass spreads the budget over experiences by giving each its
+        # best bullet, the second fills what remains in score order
+        ranked = self._rank_bullets(scores)
+        for first_pass in (True, False):
+            for score, i, j in ranked:
+                if j in chosen[i] or (first_pass and chosen[i]):
+                    continue
+                if max_bullets is not None and count >= max_bullets:
+                    break
+                if max_chars is not None and used_chars + len(text[i, j]) > max_chars:
+                    continue
+                chosen[i][j] = score
+                used_chars += len(text[i, j])
+                count += 1
+
+        tailored = {k: v for k, v in self.data.items() if k != "variants"}
+        tailored["experience"] = [
+            dict(
+                exp,
+                responsibilities=[
+                    text[i, j]
+                    for j in sorted(chosen[i], key=lambda j: (-chosen[i][j], j))
+                ],
+            )
+            for i, exp in enumerate(self.data.get("experience") or ())
+        ]
+
+        if self.data.get("skills"):
+            # Matching skills first; empty entries only pad the joined line
+            skills = [
+                (scores.get(doc_id, 0.0), i, self.documents[doc_id])
+                for doc_id, i in self.skill_ids
+                if self.documents[doc_id]
+            ]
+            skills.sort(key=lambda s: (-s[0], s[1]))
+            tailored["skills"] = [skill for _, _, skill in skills[:max_skills]]
+        return tailored
+
+    def fit(self, job_description, pages=1, max_skills=None):
+        """Return data with the most relevant bullets that fit within pages
+
+        Unlike tailor's count budgets this measures every bullet and solves a
+        knapsack, so the page is filled as densely with relevance as possible.
+        """
+        scores = self.score(job_description)
+        # A small base value fills leftover space with unmatched bullets
+        bullet_scores = {
+            (i, j): scores.get(doc_id, 0.0) + UNMATCHED_BULLET_VALUE
+            for doc_id, i, j in self.bullet_ids
+        }
+        data = dict(self.data)
+        if self.data.get("skills"):
+            data["skills"] = self.tailor(job_description, max_skills=max_skills)[
+                "skills"
+            ]
+        data.pop("variants", None)
+        if self._layout is None:
+            # Bullet heights do not depend on the job description
+            self._layout = BulletLayout(self.data)
+        return select_bullets(data, bullet_scores, pages, layout=self._layout)
+
+
+def solve_knapsack(values, weights, capacity):
+    """Indices of the subset maximizing total value within an integer capacity
+
+    Classic 0/1 dynamic program over capacities, O(len(values) * capacity).
+    Ties keep the earlier items, so the result is deterministic.
+    """
+    best = [0.0] * (capacity + 1)
+    taken = []
+    for value, weight in zip(values, weights):
+        took = bytearray(capacity + 1)
+        for c in range(capacity, weight - 1, -1):
+            candidate = best[c - weight] + value
+            if candidate > best[c]:
+                best[c] = candidate
+                took[c] = 1
+        taken.append(took)
+
+    chosen = []
+    c = capacity
+    for index in range(len(values) - 1, -1, -1):
+        if taken[index][c]:
+            chosen.append(index)
+            c -= weights[index]
+    return sorted(chosen)
+
+
+class BulletLayout:
+    """One resume's bullet heights and the rest of its story, measured once
+
+    Only the skills section varies between job descriptions (reordered or
+    cut to max_skills), so it alone is re-measured per query; every bullet
+    and the other sections are wrapped once per resume and scale.
+    """
+
+    def __init__(self, data, scale=1.0):
+        from reportlab.platypus import Paragraph
+
+        from resume_generator import FRAME_SIZE, ResumeGenerator, item_text
+
+        self.scale = scale
+        experiences = data.get("experience") or []
+        bare = dict(
+            data, experience=[dict(e, responsibilities=[]) for e in experiences]
+        )
+        generator = ResumeGenerator.from_data(bare)
+        generator.set_scale(scale)
+        # Sections are built in order, so the skills section sits between these
+        self.before = generator.wrap_story(
+            generator.build_story(exclude=("skills", "certifications", "projects"))
+        )
+        self.after = generator.wrap_story(
+            generator.build_story(
+                exclude=("personal", "experience", "education", "skills")
+            )
+        )
+
+        style = generator.styles["BulletPoint"]
+        self.bullets = []  # (experience index, bullet index, text, height)
+        for i, exp in enumerate(experiences):
+            for j, bullet in enumerate(exp.get("responsibilities") or ()):
+                text = item_text(bullet)
+                _, height = Paragraph(f"- {text}", style).wrap(*FRAME_SIZE)
+                # Consecutive bullets collapse to exactly one spaceAfter between them
+                self.bullets.append((i, j, text, height + style.spaceAfter))
+
+    def free_space(self, skills, pages=1):
+        """Height left for bullets in pages treated as one continuous frame"""
+        from resume_generator import FRAME_SIZE, ResumeGenerator, stack_height
+
+        generator = ResumeGenerator.from_data({"skills": skills})
+        generator.set_scale(self.scale)
+        middle = generator.wrap_story(generator.build_story())
+        return FRAME_SIZE[1] * pages - stack_height(self.before + middle + self.after)
+
+
+def select_bullets(data, scores, pages=1, quantum=1.0, scale=1.0, layout=None):
+    """Return a copy of data with the bullets maximizing total score that fit
+
+    scores maps (experience index, bullet index) to relevance. Bullet heights
+    and the free space beside the rest of the story come from a BulletLayout,
+    which callers pass in to reuse across queries on the same resume. The
+    space is filled by a knapsack over heights quantized to quantum points.
+    Heights are rounded up, so a one-page selection never overflows. Several
+    pages are first treated as one continuous frame, then the least relevant
+    bullets are dropped until estimate_layout confirms the selection fits.
+    Raises ValueError if the resume does not fit even without bullets.
+    """
+    from resume_generator import ResumeGenerator
+
+    if layout is None:
+        layout = BulletLayout(data, scale)
+    experiences = data.get("experience") or []
+    bullets = layout.bullets
+    free = layout.free_space(data.get("skills"), pages)
+    if free < 0:
+        raise ValueError(f"resume exceeds {pages} page(s) even without bullets")
+
+    chosen = solve_knapsack(
+        [scores.get((i, j), 0.0) for i, j, _, _ in bullets],
+        [math.ceil(height / quantum) for _, _, _, height in bullets],
+        int(free // quantum),
+    )
+
+    def assemble(chosen):
+        selected = defaultdict(list)
+        for index in chosen:
+            i, _, text, _ = bullets[index]
+            selected[i].append(text)
+        return dict(
+            data,
+            experience=[
+                dict(exp, responsibilities=selected[i])
+                for i, exp in enumerate(experiences)
+            ],
+        )
+
+    result = assemble(chosen)
+    if pages > 1:
+        # Drop the least relevant bullets until the real pagination fits
+        chosen.sort(key=lambda index: scores.get(bullets[index][:2], 0.0))
+        while True:
+            generator = ResumeGenerator.from_data(result)
+            generator.set_scale(layout.scale)
+            if generator.estimate_layout(pages=pages)["overflow"] is None:
+                break
+            if not chosen:
+                raise ValueError(f"resume exceeds {pages} page(s) even without bullets")
+            chosen.pop(0)
+            result = assemble(sorted(chosen))
+    return result
@@ -0,0 +1,156 @@
+"""
+Resume Variants
+Renders many tailored versions of one resume, selected by tags on bullets and
+skills, from a single parse
+"""
+
+import re
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+
+
+def _selected(item, tags):
+    """Whether a bullet or skill belongs in a variant with the given tags"""
+    if not isinstance(item, dict) or not tags:
+        return True
+    item_tags = item.get("tags") or ()
+    # Untagged items appear in every variant
+    return not item_tags or bool(set(item_tags) & tags)
+
+
+def select_variant(data, tags=None):
+    """Return a copy of data keeping only bullets and skills matching tags
+
+    Tagged items are written as {text: ..., tags: [...]}; plain strings and
+    items without tags are always kept. With no tags, everything is kept.
+    """
+    from resume_generator import item_text
+
+    tags = set(tags or ())
+    variant = {key: value for key, value in data.items() if key != "variants"}
+    if data.get("experience"):
+        variant["experience"] = [
+            dict(
+                exp,
+                responsibilities=[
+                    item_text(r)
+                    for r in exp.get("responsibilities") or ()
+                    if _selected(r, tags)
+                ],
+            )
+            for exp in data["experience"]
+        ]
+    if data.get("skills"):
+        variant["skills"] = [item_text(s) for s in data["skills"] if _selected(s, tags)]
+    return variant
+
+
+def variant_output_file(input_file, variant, output_dir):
+    """Output path for a variant, from its 'output' key or its name"""
+    if variant.get("output"):
+        return Path(output_dir) / variant["output"]
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", str(variant["name"])).strip("-")
+    return Path(output_dir) / f"{Path(input_file).stem}-{slug}.pdf"
+
+
+def render_variant(
+    data, output_file, engine="platypus", fit_pages=None, template=None, forms=False
+):
+    """Render one variant's data, returning (error, elapsed seconds)
+
+    data is derived from an already validated resume, so it is not checked
+    again. With a HeaderTemplate only the body is laid out and the
+    prerendered header is stamped onto it.
+    """
+    from resume_generator import ResumeGenerator
+
+    start = time.perf_counter()
+    try:
+        generator = ResumeGenerator.from_data(data, str(output_file))
+        generator.engine = engine
+        generator.use_forms = forms
+        if template is None:
+            generator.generate_pdf(verbose=False, fit_pages=fit_pages)
+        else:
+            with open(output_file, "wb") as f:
+                f.write(template.render(data))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", time.perf_counter() - start
+    return None, time.perf_counter() - start
+
+
+def render_variants(
+    input_file,
+    output_dir,
+    workers=None,
+    engine="platypus",
+    fit_pages=None,
+    overlay=False,
+    forms=False,
+):
+    """Parse input_file once and render every declared variant in parallel
+
+    With overlay, the shared personal header is rendered once as a template
+    and each variant only lays out its body. Returns a list of
+    (variant name, output file, error) tuples.
+    """
+    if overlay and (fit_pages or engine != "platypus"):
+        raise ValueError("overlay rendering needs the platypus engine at scale 1")
+    from batch import worker_pool
+    from resume_generator import ResumeGenerator
+
+    generator = ResumeGenerator(input_file)
+    generator.parse_input_file()
+    generator.validate()
+    variants = generator.data.get("variants") or []
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Build the sections every variant shares (personal, education, ...) once
+    # here; where workers fork they inherit the warm styles and section cache,
+    # otherwise each worker builds its own on its first render
+    shared = ResumeGenerator.from_data(select_variant(generator.data))
+    shared.use_forms = forms
+    shared.build_story()
+    template = None
+    if overlay:
+        from overlay import HeaderTemplate
+
+        template = HeaderTemplate(generator.data.get("personal"), forms=forms)
+        template.page()  # forked workers inherit the parsed page
+
+    # Distinct names can slug to the same file and outputs can repeat, so
+    # reject clashes before anything is rendered
+    owners = {}
+    jobs = []
+    for index, variant in enumerate(variants, start=1):
+        variant.setdefault("name", f"variant-{index}")
+        output_file = variant_output_file(input_file, variant, output_dir)
+        if output_file in owners:
+            raise ValueError(
+                f"variants {owners[output_file]!r} and {variant['name']!r} "
+                f"would both render to {output_file}"
+            )
+        owners[output_file] = variant["name"]
+        jobs.append((variant, output_file))
+
+    # The same pool as batch rendering: prewarmed under fork, and spawned or
+    # forkserver workers warm themselves up
+    results = []
+    with worker_pool(workers) as pool:
+        futures = {}
+        for variant, output_file in jobs:
+            data = select_variant(generator.data, variant.get("tags"))
+            future = pool.submit(
+                render_variant, data, output_file, engine, fit_pages, template, forms
+            )
+            futures[future] = (variant["name"], output_file)
+        for future in as_completed(futures):
+            name, output_file = futures[future]
+            try:
+                error, _ = future.result()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            results.append((name, output_file, error))
+    return results
@@ -0,0 +1,117 @@
+"""
+Rendered Resume Verification
+Checks a generated PDF against its source data with pdfplumber: page count,
+every bullet present as extractable text, and no text outside the margins
+"""
+
+import re
+from html import unescape
+from io import BytesIO
+
+import pdfplumber
+from pdfminer.layout import LTChar, LTFigure
+
+# Slack, in points, before a glyph counts as crossing a margin
+MARGIN_TOLERANCE = 1.0
+
+_CID_RE = re.compile(r"\(cid:\d+\)")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text):
+    """Collapse whitespace and drop markup and unmapped glyphs for comparison"""
+    text = unescape(_TAG_RE.sub("", _CID_RE.sub(" ", text)))
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def expected_snippets(data):
+    """Yield (label, text) pairs that must appear in the rendered resume"""
+    from resume_generator import item_text
+
+    personal = data.get("personal") or {}
+    if personal.get("name"):
+        yield "name", personal["name"]
+    for exp in data.get("experience") or ():
+        for key in ("company", "title"):
+            if exp.get(key):
+                yield key, exp[key]
+        for bullet in exp.get("responsibilities") or ():
+            yield "bullet", item_text(bullet)
+    for skill in data.get("skills") or ():
+        if item_text(skill):
+            yield "skill", item_text(skill)
+
+
+def _glyphs(container):
+    """Yield the characters of a pdfminer layout, including form XObjects"""
+    for item in container:
+        if isinstance(item, LTChar):
+            yield item
+        elif isinstance(item, LTFigure):
+            yield from _glyphs(item)
+
+
+def verify_pdf(pdf, data, max_pages=None, margins=None):
+    """Return a list of problems found in pdf (a path or bytes); empty if OK"""
+    from resume_generator import PAGE_MARGINS
+
+    margins = margins or PAGE_MARGINS
+    if isinstance(pdf, (bytes, bytearray)):
+        pdf = BytesIO(pdf)
+
+    problems = []
+    # Without layout analysis pdfplumber hands back pdfminer's raw glyph
+    # objects; reading them directly skips building a dict per character
+    with pdfplumber.open(pdf, laparams=None) as document:
+        pages = document.pages
+        if max_pages is not None and len(pages) > max_pages:
+            problems.append(f"{len(pages)} pages, expected at most {max_pages}")
+
+        texts = []
+        for number, page in enumerate(pages, start=1):
+            left = margins["leftMargin"] - MARGIN_TOLERANCE
+            right = page.width - margins["rightMargin"] + MARGIN_TOLERANCE
+            bottom = margins["bottomMargin"] - MARGIN_TOLERANCE
+            top = page.height - margins["topMargin"] + MARGIN_TOLERANCE
+            clipped = 0
+            previous = None
+            for glyph in _glyphs(page.layout):
+                if (
+                    glyph.x0 < left
+                    or glyph.x1 > right
+                    or glyph.y0 < bottom
+                    or glyph.y1 > top
+                ):
+                    clipped += 1
+                # Separate glyphs that start a new line or follow a gap
+                if previous is not None and (
+                    abs(glyph.y0 - previous.y0) > 1 or glyph.x0 - previous.x1 > 1
+                ):
+                    texts.append(" ")
+                texts.append(glyph.get_text())
+                previous = glyph
+            texts.append(" ")
+            if clipped:
+                problems.append(
+                    f"page {number}: {clipped} glyph(s) outside the margins"
+                )
+
+    # Lines wrap anywhere, so compare against the whole document as one string
+    text = normalize_text("".join(texts))
+    for label, snippet in expected_snippets(data):
+        if normalize_text(snippet) not in text:
+            problems.append(f"missing {label}: {snippet[:60]!r}")
+    return problems
+
+
+def verify_file(input_file, output_file, max_pages=None, snapshot_dir=None):
+    """Re-parse input_file and verify output_file, returning the problems"""
+    from resume_generator import ResumeGenerator
+
+    generator = ResumeGenerator(str(input_file), snapshot_dir=snapshot_dir)
+    generator.parse_input_file()
+    try:
+        return verify_pdf(str(output_file), generator.data, max_pages)
+    except Exception as e:
+        return [f"unreadable PDF: {type(e).__name__}: {e}"]
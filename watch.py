@@ -0,0 +1,82 @@
+"""
+Input File Watcher
+Calls back after a file is saved, using watchdog (inotify) when installed and
+falling back to polling its modification time otherwise
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+
+def _signature(path):
+    """Cheap change signature of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _start_observer(path, changed):
+    """Set changed on filesystem events for path; return the observer or None"""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    target = str(Path(path).resolve())
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Editors often save via rename, so match either end of a move
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if target in (str(Path(p).resolve()) for p in paths if p):
+                changed.set()
+
+    observer = Observer()
+    observer.schedule(Handler(), str(Path(target).parent))
+    observer.daemon = True
+    observer.start()
+    return observer
+
+
+def watch_file(path, on_change, poll_interval=0.2, debounce=0.3):
+    """Call on_change each time path changes, until interrupted
+
+    Bursts of writes (editors saving in several steps) are debounced: the
+    callback runs once the file has been quiet for debounce seconds.
+    """
+    changed = threading.Event()
+    observer = _start_observer(path, changed)
+    last = _signature(path)
+    try:
+        while True:
+            if observer is not None:
+                changed.wait()
+                changed.clear()
+            else:
+                time.sleep(poll_interval)
+                if _signature(path) == last:
+                    continue
+
+            # Wait for the file to settle before re-rendering
+            while True:
+                current = _signature(path)
+                time.sleep(debounce)
+                if _signature(path) == current:
+                    break
+            changed.clear()
+
+            if current is None or current == last:
+                continue
+            last = current
+            on_change()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()